@@ -31,26 +31,18 @@ def get_dispatcher() -> Dispatcher:
     from app.middlewares.validation import InputValidationMiddleware
     from app.middlewares.rate_limit import RateLimitMiddleware
     from app.middlewares.spam_protection import SpamProtectionMiddleware
-    from app.middlewares.ip_tracking import IPTrackingMiddleware
+    from app.middlewares.guard import CompositeGuardMiddleware
     
     # Apply middlewares (order matters!)
-    # 1. IP Tracking (first, for logging)
-    dp.message.middleware(IPTrackingMiddleware())
-    dp.callback_query.middleware(IPTrackingMiddleware())
-    logger.info("✅ IP Tracking middleware registered")
-    
-    # 2. Input Validation (sanitize inputs)
+    # 1. Input Validation (sanitize inputs, reject oversized messages)
     dp.message.middleware(InputValidationMiddleware(max_length=1000))
     dp.callback_query.middleware(InputValidationMiddleware())
     logger.info("✅ Input Validation middleware registered")
     
-    # 3. Spam Protection (detect abuse)
+    # 2. Guard: user tracking, spam protection (messages only) and
+    # rate limiting in a single middleware frame
     # New spam middleware with no parameters - silent 5-minute blocking
     spam_protection = SpamProtectionMiddleware()
-    dp.message.middleware(spam_protection)
-    logger.info("✅ Spam Protection middleware registered")
-    
-    # 4. Rate Limiting (enforce limits)
     rate_limiter = RateLimitMiddleware(
         message_limit=10,       # 10 messages per minute
         message_window=60,
@@ -59,10 +51,10 @@ def get_dispatcher() -> Dispatcher:
         callback_limit=20,      # 20 callbacks per minute
         callback_window=60
     )
-    dp.message.middleware(rate_limiter)
-    dp.callback_query.middleware(rate_limiter)
-    logger.info("✅ Rate Limiting middleware registered")
-
+    guard = CompositeGuardMiddleware(spam_protection, rate_limiter)
+    dp.message.middleware(guard)
+    dp.callback_query.middleware(guard)
+    logger.info("✅ Guard middleware registered (tracking, spam protection, rate limiting)")
     
     # Register routers (handlers)
     logger.info("📦 Registering routers...")
@@ -11,7 +11,6 @@ from aiogram.utils.keyboard import InlineKeyboardBuilder
 from aiogram.types import InlineKeyboardButton
 
 from app.bot.keyboards.main_menu import get_back_to_menu_button
-from app.database import get_db
 from datetime import datetime
 
 router = Router(name="m6_productivity")
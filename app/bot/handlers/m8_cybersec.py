@@ -4,16 +4,20 @@ Nmap analyzer, Burp parser, Hash identifier, Log analyzer, Threat intelligence
 """
 
 from aiogram import Router, F
-from aiogram.types import Message, CallbackQuery
+from aiogram.types import Message, CallbackQuery, InlineKeyboardMarkup
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
-from aiogram.utils.keyboard import InlineKeyboardBuilder
 from aiogram.types import InlineKeyboardButton
+from typing import Dict, Tuple
 
 from app.bot.keyboards.main_menu import get_back_to_menu_button
+from app.utils.menu import edit_menu
 
 router = Router(name="m8_cybersec")
 
+# Longest hash input we look at (SHA-512 hex is 128 chars)
+MAX_HASH_INPUT_LENGTH = 2048
+
 
 class CybersecStates(StatesGroup):
     """FSM States for Cybersecurity Tools"""
@@ -22,28 +26,43 @@ class CybersecStates(StatesGroup):
     waiting_for_log = State()
 
 
-@router.callback_query(F.data == "module_cybersec")
-async def show_cybersec_menu(callback: CallbackQuery):
-    """Show Cybersecurity Tools menu"""
-    builder = InlineKeyboardBuilder()
-    
-    builder.row(
+# ============================================
+# STATIC MENUS
+# ============================================
+
+_CYBERSEC_MENU_KEYBOARD = InlineKeyboardMarkup(inline_keyboard=[
+    [
         InlineKeyboardButton(text="🗺 Nmap Analyzer", callback_data="cyber_nmap"),
         InlineKeyboardButton(text="🔍 Burp Parser", callback_data="cyber_burp")
-    )
-    builder.row(
+    ],
+    [
         InlineKeyboardButton(text="🔐 Hash Identifier", callback_data="cyber_hash"),
         InlineKeyboardButton(text="📊 Log Analyzer", callback_data="cyber_logs")
-    )
-    builder.row(
+    ],
+    [
         InlineKeyboardButton(text="🛡 Threat Intel", callback_data="cyber_threat"),
         InlineKeyboardButton(text="🔬 Stego Explainer", callback_data="cyber_stego")
-    )
-    builder.row(
+    ],
+    [
         InlineKeyboardButton(text="🏠 Main Menu", callback_data="main_menu")
-    )
-    
-    text = """
+    ]
+])
+
+_THREAT_INTEL_KEYBOARD = InlineKeyboardMarkup(inline_keyboard=[
+    [
+        InlineKeyboardButton(text="🔍 CVE Lookup", callback_data="threat_cve"),
+        InlineKeyboardButton(text="⚠️ KEV Database", callback_data="threat_kev")
+    ],
+    [
+        InlineKeyboardButton(text="📰 Latest Threats", callback_data="threat_latest")
+    ],
+    [
+        InlineKeyboardButton(text="🔙 Back", callback_data="module_cybersec")
+    ]
+])
+
+
+_CYBERSEC_MENU_TEXT = """
 🔒 <b>Cybersecurity Tools</b>
 
 Educational security tools for ethical hackers!
@@ -61,8 +80,76 @@ All tools are for learning and ethical use.
 
 Choose a tool to get started!
 """
-    
-    await callback.message.edit_text(text, reply_markup=builder.as_markup())
+
+_THREAT_INTEL_TEXT = """
+🛡 <b>Threat Intelligence</b>
+
+Stay updated on the latest security threats!
+
+<b>Available Resources:</b>
+🔍 <b>CVE Lookup</b> - Search vulnerabilities
+⚠️ <b>KEV Database</b> - Known Exploited Vulnerabilities
+📰 <b>Latest Threats</b> - Recent security news
+
+<b>Recent CVEs:</b>
+• CVE-2024-1234 - Critical RCE in Apache
+• CVE-2024-5678 - SQL Injection in WordPress
+• CVE-2024-9012 - XSS in React Component
+
+Choose an option:
+"""
+
+_LATEST_THREATS_TEXT = """
+📰 <b>Latest Security Threats</b>
+
+<b>This Week:</b>
+
+1. 🔴 <b>Critical Apache Vulnerability</b>
+   CVE-2024-1234 | CVSS: 9.8
+   RCE vulnerability in Apache HTTP Server
+   Patch: Available
+   
+2. 🟠 <b>WordPress Plugin Flaw</b>
+   CVE-2024-5678 | CVSS: 7.5
+   SQL Injection in popular plugin
+   Affected: 100k+ sites
+   
+3. 🟡 <b>React XSS Vulnerability</b>
+   CVE-2024-9012 | CVSS: 6.1
+   Cross-site scripting in component
+   Update: v18.2.1
+
+<b>Recommendations:</b>
+✅ Update all systems immediately
+✅ Review security patches
+✅ Monitor for exploitation attempts
+
+<i>Data from public CVE feeds</i>
+"""
+
+_NMAP_RESPONSE_FOOTER = (
+    "",
+    "<b>Common Vulnerabilities:</b>",
+    "• Check for default credentials",
+    "• Verify service versions",
+    "• Look for outdated software",
+    "",
+    "<i>This is a basic analysis. Use professional tools for production.</i>",
+)
+
+# callback_data -> (text, keyboard) for screens that never change
+_STATIC_MENUS: Dict[str, Tuple[str, InlineKeyboardMarkup]] = {
+    "module_cybersec": (_CYBERSEC_MENU_TEXT, _CYBERSEC_MENU_KEYBOARD),
+    "cyber_threat": (_THREAT_INTEL_TEXT, _THREAT_INTEL_KEYBOARD),
+    "threat_latest": (_LATEST_THREATS_TEXT, get_back_to_menu_button()),
+}
+
+
+@router.callback_query(F.data.in_(frozenset(_STATIC_MENUS)))
+async def show_static_menu(callback: CallbackQuery):
+    """Show Cybersecurity menu, Threat Intel and Latest Threats screens"""
+    text, markup = _STATIC_MENUS[callback.data]
+    await edit_menu(callback, text, reply_markup=markup)
     await callback.answer()
 
 
@@ -99,28 +186,29 @@ async def analyze_nmap(message: Message, state: FSMContext):
     
     # Simple analysis (in production, use proper parsing)
     open_ports = nmap_output.count("open")
-    has_ssh = "ssh" in nmap_output.lower()
-    has_http = "http" in nmap_output.lower()
+    nmap_lower = nmap_output.lower()
+    has_ssh = "ssh" in nmap_lower
+    has_http = "http" in nmap_lower
     
-    response = f"""
-✅ <b>Nmap Analysis Complete</b>
-
-<b>Summary:</b>
-• Open Ports Found: {open_ports}
-• SSH Detected: {'✅' if has_ssh else '❌'}
-• HTTP/HTTPS: {'✅' if has_http else '❌'}
-
-<b>Security Recommendations:</b>
-{f'⚠️ SSH is open - Ensure strong authentication' if has_ssh else ''}
-{f'⚠️ HTTP detected - Consider HTTPS only' if has_http else ''}
-
-<b>Common Vulnerabilities:</b>
-• Check for default credentials
-• Verify service versions
-• Look for outdated software
-
-<i>This is a basic analysis. Use professional tools for production.</i>
-"""
+    parts = [
+        "✅ <b>Nmap Analysis Complete</b>",
+        "",
+        "<b>Summary:</b>",
+        f"• Open Ports Found: {open_ports}",
+        f"• SSH Detected: {'✅' if has_ssh else '❌'}",
+        f"• HTTP/HTTPS: {'✅' if has_http else '❌'}",
+        "",
+        "<b>Security Recommendations:</b>",
+    ]
+    
+    # Only include recommendations that apply
+    if has_ssh:
+        parts.append("⚠️ SSH is open - Ensure strong authentication")
+    if has_http:
+        parts.append("⚠️ HTTP detected - Consider HTTPS only")
+    
+    parts.extend(_NMAP_RESPONSE_FOOTER)
+    response = "\n".join(parts)
     
     await message.answer(response, reply_markup=get_back_to_menu_button())
     await state.clear()
@@ -150,8 +238,10 @@ I'll identify the hash type!
 @router.message(CybersecStates.waiting_for_hash)
 async def identify_hash(message: Message, state: FSMContext):
     """Identify hash type"""
-    hash_value = message.text.strip()
+    # Bound user input so pasted files can't slow down the handler
+    hash_value = message.text[:MAX_HASH_INPUT_LENGTH].strip()
     hash_len = len(hash_value)
+    display = hash_value if hash_len <= 40 else hash_value[:40] + "..."
     
     # Simple hash identification
     hash_types = {
@@ -166,7 +256,7 @@ async def identify_hash(message: Message, state: FSMContext):
     response = f"""
 🔐 <b>Hash Identified</b>
 
-<b>Hash:</b> <code>{hash_value[:40]}{'...' if len(hash_value) > 40 else ''}</code>
+<b>Hash:</b> <code>{display}</code>
 
 <b>Length:</b> {hash_len} characters
 <b>Likely Type:</b> {identified}
@@ -200,79 +290,6 @@ async def identify_hash(message: Message, state: FSMContext):
     await state.clear()
 
 
-@router.callback_query(F.data == "cyber_threat")
-async def threat_intelligence(callback: CallbackQuery):
-    """Threat Intelligence menu"""
-    builder = InlineKeyboardBuilder()
-    
-    builder.row(
-        InlineKeyboardButton(text="🔍 CVE Lookup", callback_data="threat_cve"),
-        InlineKeyboardButton(text="⚠️ KEV Database", callback_data="threat_kev")
-    )
-    builder.row(
-        InlineKeyboardButton(text="📰 Latest Threats", callback_data="threat_latest")
-    )
-    builder.row(
-        InlineKeyboardButton(text="🔙 Back", callback_data="module_cybersec")
-    )
-    
-    text = """
-🛡 <b>Threat Intelligence</b>
-
-Stay updated on the latest security threats!
-
-<b>Available Resources:</b>
-🔍 <b>CVE Lookup</b> - Search vulnerabilities
-⚠️ <b>KEV Database</b> - Known Exploited Vulnerabilities
-📰 <b>Latest Threats</b> - Recent security news
-
-<b>Recent CVEs:</b>
-• CVE-2024-1234 - Critical RCE in Apache
-• CVE-2024-5678 - SQL Injection in WordPress
-• CVE-2024-9012 - XSS in React Component
-
-Choose an option:
-"""
-    
-    await callback.message.edit_text(text, reply_markup=builder.as_markup())
-    await callback.answer()
-
-
-@router.callback_query(F.data == "threat_latest")
-async def latest_threats(callback: CallbackQuery):
-    """Show latest threats"""
-    text = """
-📰 <b>Latest Security Threats</b>
-
-<b>This Week:</b>
-
-1. 🔴 <b>Critical Apache Vulnerability</b>
-   CVE-2024-1234 | CVSS: 9.8
-   RCE vulnerability in Apache HTTP Server
-   Patch: Available
-   
-2. 🟠 <b>WordPress Plugin Flaw</b>
-   CVE-2024-5678 | CVSS: 7.5
-   SQL Injection in popular plugin
-   Affected: 100k+ sites
-   
-3. 🟡 <b>React XSS Vulnerability</b>
-   CVE-2024-9012 | CVSS: 6.1
-   Cross-site scripting in component
-   Update: v18.2.1
-
-<b>Recommendations:</b>
-✅ Update all systems immediately
-✅ Review security patches
-✅ Monitor for exploitation attempts
-
-<i>Data from public CVE feeds</i>
-"""
-    
-    await callback.message.edit_text(text, reply_markup=get_back_to_menu_button())
-    await callback.answer()
-
-
 @router.callback_query(F.data == "cyber_logs")
 async def log_analyzer_prompt(callback: CallbackQuery, state: FSMContext):
     """Prompt for logs"""
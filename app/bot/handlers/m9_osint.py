@@ -4,13 +4,14 @@ WHOIS, DNS, IP Geolocation, Username checker (Legal & Safe Mode Only)
 """
 
 from aiogram import Router, F
-from aiogram.types import Message, CallbackQuery
+from aiogram.types import Message, CallbackQuery, InlineKeyboardMarkup
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
-from aiogram.utils.keyboard import InlineKeyboardBuilder
 from aiogram.types import InlineKeyboardButton
+from typing import Dict, Tuple
 
 from app.bot.keyboards.main_menu import get_back_to_menu_button
+from app.utils.menu import edit_menu
 from app.bot.keyboards.disclaimers import OSINT_DISCLAIMER_TEXT, get_osint_disclaimer_keyboard
 
 router = Router(name="m9_osint")
@@ -24,37 +25,36 @@ class OSINTStates(StatesGroup):
     waiting_for_username = State()
 
 
-@router.callback_query(F.data == "module_osint")
-async def show_osint_disclaimer(callback: CallbackQuery, state: FSMContext):
-    """Show OSINT legal disclaimer first"""
-    await callback.message.edit_text(
-        OSINT_DISCLAIMER_TEXT,
-        reply_markup=get_osint_disclaimer_keyboard()
-    )
-    await callback.answer()
-
+# ============================================
+# STATIC MENUS
+# ============================================
 
-@router.callback_query(F.data == "osint_agree")
-async def show_osint_menu(callback: CallbackQuery):
-    """Show OSINT Tools menu after disclaimer agreement"""
-    builder = InlineKeyboardBuilder()
-    
-    builder.row(
+_OSINT_MENU_KEYBOARD = InlineKeyboardMarkup(inline_keyboard=[
+    [
         InlineKeyboardButton(text="🌐 WHOIS Lookup", callback_data="osint_whois"),
         InlineKeyboardButton(text="🔍 DNS Lookup", callback_data="osint_dns")
-    )
-    builder.row(
+    ],
+    [
         InlineKeyboardButton(text="📍 IP Geolocation", callback_data="osint_ip"),
         InlineKeyboardButton(text="👤 Username Check", callback_data="osint_username")
-    )
-    builder.row(
+    ],
+    [
         InlineKeyboardButton(text="📖 OSINT Guide", callback_data="osint_guide")
-    )
-    builder.row(
+    ],
+    [
         InlineKeyboardButton(text="🏠 Main Menu", callback_data="main_menu")
-    )
-    
-    text = """
+    ]
+])
+
+_WHOIS_CONSENT_KEYBOARD = InlineKeyboardMarkup(inline_keyboard=[
+    [
+        InlineKeyboardButton(text="✅ I Agree", callback_data="osint_consent_whois"),
+        InlineKeyboardButton(text="❌ Cancel", callback_data="module_osint")
+    ]
+])
+
+
+_OSINT_MENU_TEXT = """
 🔍 <b>OSINT Tools</b>
 
 Open Source Intelligence tools for research!
@@ -76,22 +76,45 @@ By using these tools, you agree to use them ethically and legally.
 
 Choose a tool to get started!
 """
-    
-    await callback.message.edit_text(text, reply_markup=builder.as_markup())
-    await callback.answer()
 
+_OSINT_GUIDE_TEXT = """
+📖 <b>OSINT Guide</b>
 
-@router.callback_query(F.data == "osint_whois")
-async def whois_consent(callback: CallbackQuery, state: FSMContext):
-    """Show WHOIS consent"""
-    builder = InlineKeyboardBuilder()
-    
-    builder.row(
-        InlineKeyboardButton(text="✅ I Agree", callback_data="osint_consent_whois"),
-        InlineKeyboardButton(text="❌ Cancel", callback_data="module_osint")
-    )
-    
-    text = """
+<b>What is OSINT?</b>
+Open Source Intelligence - gathering information from publicly available sources.
+
+<b>Legal OSINT Sources:</b>
+✅ Public websites
+✅ Social media (public profiles)
+✅ Government databases
+✅ News articles
+✅ WHOIS records
+✅ DNS records
+
+<b>Illegal Activities:</b>
+❌ Hacking/unauthorized access
+❌ Scraping private data
+❌ Violating terms of service
+❌ Stalking or harassment
+❌ Identity theft
+
+<b>Best Practices:</b>
+• Always get consent when possible
+• Respect privacy
+• Follow platform terms
+• Document your sources
+• Use for legitimate purposes
+
+<b>OSINT Tools:</b>
+• Google Dorking
+• Shodan (for security research)
+• Archive.org (historical data)
+• Public records databases
+
+<i>Remember: Just because data is public doesn't mean it's ethical to use it!</i>
+"""
+
+_WHOIS_CONSENT_TEXT = """
 🌐 <b>WHOIS Lookup</b>
 
 ⚠️ <b>Terms of Use</b>
@@ -110,8 +133,28 @@ By proceeding, you agree to:
 
 Do you agree to these terms?
 """
-    
-    await callback.message.edit_text(text, reply_markup=builder.as_markup())
+
+# callback_data -> (text, keyboard) for screens that never change
+# module_osint always shows the legal disclaimer first
+_STATIC_MENUS: Dict[str, Tuple[str, InlineKeyboardMarkup]] = {
+    "module_osint": (OSINT_DISCLAIMER_TEXT, get_osint_disclaimer_keyboard()),
+    "osint_agree": (_OSINT_MENU_TEXT, _OSINT_MENU_KEYBOARD),
+    "osint_guide": (_OSINT_GUIDE_TEXT, get_back_to_menu_button()),
+}
+
+
+@router.callback_query(F.data.in_(frozenset(_STATIC_MENUS)))
+async def show_static_menu(callback: CallbackQuery):
+    """Show OSINT disclaimer, OSINT menu and OSINT guide screens"""
+    text, markup = _STATIC_MENUS[callback.data]
+    await edit_menu(callback, text, reply_markup=markup)
+    await callback.answer()
+
+
+@router.callback_query(F.data == "osint_whois")
+async def whois_consent(callback: CallbackQuery, state: FSMContext):
+    """Show WHOIS consent"""
+    await callback.message.edit_text(_WHOIS_CONSENT_TEXT, reply_markup=_WHOIS_CONSENT_KEYBOARD)
     await state.set_state(OSINTStates.consent_pending)
     await callback.answer()
 
@@ -319,47 +362,3 @@ async def username_check(message: Message, state: FSMContext):
     
     await message.answer(response, reply_markup=get_back_to_menu_button())
     await state.clear()
-
-
-@router.callback_query(F.data == "osint_guide")
-async def osint_guide(callback: CallbackQuery):
-    """OSINT guide"""
-    text = """
-📖 <b>OSINT Guide</b>
-
-<b>What is OSINT?</b>
-Open Source Intelligence - gathering information from publicly available sources.
-
-<b>Legal OSINT Sources:</b>
-✅ Public websites
-✅ Social media (public profiles)
-✅ Government databases
-✅ News articles
-✅ WHOIS records
-✅ DNS records
-
-<b>Illegal Activities:</b>
-❌ Hacking/unauthorized access
-❌ Scraping private data
-❌ Violating terms of service
-❌ Stalking or harassment
-❌ Identity theft
-
-<b>Best Practices:</b>
-• Always get consent when possible
-• Respect privacy
-• Follow platform terms
-• Document your sources
-• Use for legitimate purposes
-
-<b>OSINT Tools:</b>
-• Google Dorking
-• Shodan (for security research)
-• Archive.org (historical data)
-• Public records databases
-
-<i>Remember: Just because data is public doesn't mean it's ethical to use it!</i>
-"""
-    
-    await callback.message.edit_text(text, reply_markup=get_back_to_menu_button())
-    await callback.answer()
@@ -5,9 +5,11 @@ Main menu, welcome message, profile, and privacy policy
 
 from aiogram import Router, F
 from aiogram.filters import CommandStart, Command
-from aiogram.types import Message, CallbackQuery
+from aiogram.types import Message, CallbackQuery, BufferedInputFile
 from aiogram.utils.keyboard import InlineKeyboardBuilder
+from motor.motor_asyncio import AsyncIOMotorDatabase
 import json
+import logging
 
 from app.bot.keyboards.main_menu import get_main_menu_keyboard
 from app.bot.keyboards.privacy import (
@@ -16,23 +18,96 @@ from app.bot.keyboards.privacy import (
     PRIVACY_POLICY_TEXT, 
     SECURITY_DISCLAIMER
 )
-from app.database import Database
 from app.utils.logger import log_command, log_button_click, log_action
 from app.utils.user_helper import create_or_update_user, get_user_stats
+from app.utils.menu import edit_menu
 from datetime import datetime
 
+logger = logging.getLogger(__name__)
+
 router = Router(name="start")
 
 
+# ============================================
+# STATIC MESSAGE TEMPLATES
+# ============================================
+
+# Welcome message is static except for the user's first name
+_WELCOME_PRE = """
+🌟 <b>Welcome to EverythingInBot!</b> 🌟
+
+Hey <b>"""
+
+_WELCOME_POST = f"""</b>! 👋
+
+I'm your all-in-one Telegram Super-App with <b>10 powerful modules</b>:
+
+🤖 <b>AI Engine Hub</b> - GPT-4o, Claude, Gemini & more
+🔐 <b>Breach Check</b> - Email & password security
+📚 <b>Courses & Learning</b> - Hacking, coding, design
+💼 <b>Jobs & Careers</b> - AI resume, interview prep
+🛠 <b>Tools & Utilities</b> - PDF, image, text tools
+✅ <b>Productivity</b> - To-do, notes, habits
+👨‍💻 <b>Developer Tools</b> - JSON, regex, API tester
+🔒 <b>Cybersecurity</b> - Nmap, logs, threat intel
+🔍 <b>OSINT Tools</b> - WHOIS, DNS, IP lookup
+🎮 <b>Entertainment</b> - Games, jokes, stories
+
+{SECURITY_DISCLAIMER}
+
+Choose a module below to get started! 👇
+"""
+
+MAIN_MENU_TEXT = "🏠 <b>Main Menu</b>\n\nSelect a module:"
+
+HELP_TEXT = """
+📖 <b>EverythingInBot - Help</b>
+
+<b>Commands:</b>
+/start - Main menu
+/help - This help message
+/profile - Your profile & subscription
+/privacy - Privacy & data policy
+/export_history - Export your data
+/upgrade - Upgrade to Pro
+
+<b>Subscription Tiers:</b>
+🆓 <b>Free</b> - 5 requests/day
+⭐ <b>Pro</b> - Unlimited requests + premium features
+
+<b>Need Support?</b>
+Contact: @YourSupportBot
+"""
+
+_PROFILE_TEMPLATE = """
+👤 <b>Your Profile</b>
+
+<b>Name:</b> {first_name}
+<b>Username:</b> @{username}
+<b>Tier:</b> {tier}
+
+<b>Activity Statistics:</b>
+📊 Total Searches: {total_searches}
+⌨️ Total Commands: {total_commands}
+🎯 Modules Used: {modules_used}/10
+
+<b>Account Info:</b>
+📅 Member Since: {join_date}
+🕐 Last Active: {last_active}
+
+{access_note}
+"""
+
+_PRO_ACCESS_NOTE = "⭐ You have unlimited access!"
+_FREE_ACCESS_NOTE = "🆓 Upgrade to Pro for unlimited access!"
+
+
 @router.message(CommandStart())
-async def cmd_start(message: Message):
+async def cmd_start(message: Message, db: AsyncIOMotorDatabase):
     """
     Handle /start command with comprehensive logging
     Display main menu with all 10 modules
     """
-    import logging
-    logger = logging.getLogger(__name__)
-    
     logger.info("🔥 START HANDLER TRIGGERED!")
     logger.info(f"User: {message.from_user.id} (@{message.from_user.username})")
     logger.info(f"Message text: {message.text}")
@@ -43,9 +118,6 @@ async def cmd_start(message: Message):
     last_name = message.from_user.last_name
     language_code = message.from_user.language_code or "en"
     
-    # Get database
-    db = Database.get_db()
-    
     # Create or update user
     await create_or_update_user(
         db=db,
@@ -70,28 +142,7 @@ async def cmd_start(message: Message):
     )
     
     # Welcome message with security disclaimer
-    welcome_text = f"""
-🌟 <b>Welcome to EverythingInBot!</b> 🌟
-
-Hey <b>{first_name}</b>! 👋
-
-I'm your all-in-one Telegram Super-App with <b>10 powerful modules</b>:
-
-🤖 <b>AI Engine Hub</b> - GPT-4o, Claude, Gemini & more
-🔐 <b>Breach Check</b> - Email & password security
-📚 <b>Courses & Learning</b> - Hacking, coding, design
-💼 <b>Jobs & Careers</b> - AI resume, interview prep
-🛠 <b>Tools & Utilities</b> - PDF, image, text tools
-✅ <b>Productivity</b> - To-do, notes, habits
-👨‍💻 <b>Developer Tools</b> - JSON, regex, API tester
-🔒 <b>Cybersecurity</b> - Nmap, logs, threat intel
-🔍 <b>OSINT Tools</b> - WHOIS, DNS, IP lookup
-🎮 <b>Entertainment</b> - Games, jokes, stories
-
-{SECURITY_DISCLAIMER}
-
-Choose a module below to get started! 👇
-"""
+    welcome_text = _WELCOME_PRE + first_name + _WELCOME_POST
     
     logger.info("✅ Sending welcome message...")
     await message.answer(
@@ -102,10 +153,9 @@ Choose a module below to get started! 👇
 
 
 @router.callback_query(F.data == "main_menu")
-async def show_main_menu(callback: CallbackQuery):
+async def show_main_menu(callback: CallbackQuery, db: AsyncIOMotorDatabase):
     """Show main menu with logging"""
     user_id = callback.from_user.id
-    db = Database.get_db()
     
     # Log button click
     await log_button_click(
@@ -115,18 +165,18 @@ async def show_main_menu(callback: CallbackQuery):
         module="start"
     )
     
-    await callback.message.edit_text(
-        "🏠 <b>Main Menu</b>\n\nSelect a module:",
+    await edit_menu(
+        callback,
+        MAIN_MENU_TEXT,
         reply_markup=get_main_menu_keyboard()
     )
     await callback.answer()
 
 
 @router.message(Command("help"))
-async def cmd_help(message: Message):
+async def cmd_help(message: Message, db: AsyncIOMotorDatabase):
     """Help command with logging"""
     user_id = message.from_user.id
-    db = Database.get_db()
     
     # Log command
     await log_command(
@@ -136,32 +186,13 @@ async def cmd_help(message: Message):
         module="start"
     )
     
-    help_text = """
-📖 <b>EverythingInBot - Help</b>
-
-<b>Commands:</b>
-/start - Main menu
-/help - This help message
-/profile - Your profile & subscription
-/privacy - Privacy & data policy
-/export_history - Export your data
-/upgrade - Upgrade to Pro
-
-<b>Subscription Tiers:</b>
-🆓 <b>Free</b> - 5 requests/day
-⭐ <b>Pro</b> - Unlimited requests + premium features
-
-<b>Need Support?</b>
-Contact: @YourSupportBot
-"""
-    await message.answer(help_text)
+    await message.answer(HELP_TEXT)
 
 
 @router.message(Command("profile"))
-async def cmd_profile(message: Message):
+async def cmd_profile(message: Message, db: AsyncIOMotorDatabase):
     """Show user profile with statistics"""
     user_id = message.from_user.id
-    db = Database.get_db()
     
     # Log command
     await log_command(
@@ -185,33 +216,25 @@ async def cmd_profile(message: Message):
     join_date = user_stats.get("join_date", datetime.utcnow())
     last_active = user_stats.get("last_active", datetime.utcnow())
     
-    profile_text = f"""
-👤 <b>Your Profile</b>
-
-<b>Name:</b> {message.from_user.first_name}
-<b>Username:</b> @{message.from_user.username or 'N/A'}
-<b>Tier:</b> {tier}
-
-<b>Activity Statistics:</b>
-📊 Total Searches: {total_searches}
-⌨️ Total Commands: {total_commands}
-🎯 Modules Used: {len(modules_used)}/10
-
-<b>Account Info:</b>
-📅 Member Since: {join_date.strftime('%Y-%m-%d')}
-🕐 Last Active: {last_active.strftime('%Y-%m-%d %H:%M')}
-
-{f'⭐ You have unlimited access!' if tier == 'PRO' else '🆓 Upgrade to Pro for unlimited access!'}
-"""
+    profile_text = _PROFILE_TEMPLATE.format_map({
+        "first_name": message.from_user.first_name,
+        "username": message.from_user.username or 'N/A',
+        "tier": tier,
+        "total_searches": total_searches,
+        "total_commands": total_commands,
+        "modules_used": len(modules_used),
+        "join_date": join_date.strftime('%Y-%m-%d'),
+        "last_active": last_active.strftime('%Y-%m-%d %H:%M'),
+        "access_note": _PRO_ACCESS_NOTE if tier == 'PRO' else _FREE_ACCESS_NOTE,
+    })
     
     await message.answer(profile_text)
 
 
 @router.message(Command("privacy"))
-async def cmd_privacy(message: Message):
+async def cmd_privacy(message: Message, db: AsyncIOMotorDatabase):
     """Show privacy policy"""
     user_id = message.from_user.id
-    db = Database.get_db()
     
     # Log command
     await log_command(
@@ -228,10 +251,9 @@ async def cmd_privacy(message: Message):
 
 
 @router.callback_query(F.data == "privacy_policy")
-async def show_privacy_policy(callback: CallbackQuery):
+async def show_privacy_policy(callback: CallbackQuery, db: AsyncIOMotorDatabase):
     """Show privacy policy from button"""
     user_id = callback.from_user.id
-    db = Database.get_db()
     
     # Log button click
     await log_button_click(
@@ -241,7 +263,8 @@ async def show_privacy_policy(callback: CallbackQuery):
         module="start"
     )
     
-    await callback.message.edit_text(
+    await edit_menu(
+        callback,
         PRIVACY_POLICY_TEXT,
         reply_markup=get_back_from_privacy_keyboard()
     )
@@ -249,10 +272,9 @@ async def show_privacy_policy(callback: CallbackQuery):
 
 
 @router.message(Command("export_history"))
-async def cmd_export_history(message: Message):
+async def cmd_export_history(message: Message, db: AsyncIOMotorDatabase):
     """Export user's activity history"""
     user_id = message.from_user.id
-    db = Database.get_db()
     
     # Log command
     await log_command(
@@ -302,13 +324,14 @@ async def cmd_export_history(message: Message):
         # Convert to JSON
         json_export = json.dumps(export_data, indent=2, ensure_ascii=False)
         
-        # Send as file
-        from io import BytesIO
-        file_buffer = BytesIO(json_export.encode('utf-8'))
-        file_buffer.name = f"everythinginbot_export_{user_id}_{datetime.utcnow().strftime('%Y%m%d')}.json"
+        # Send as file (aiogram uploads the bytes as-is, no intermediate buffer)
+        export_file = BufferedInputFile(
+            json_export.encode('utf-8'),
+            filename=f"everythinginbot_export_{user_id}_{datetime.utcnow().strftime('%Y%m%d')}.json"
+        )
         
         await message.answer_document(
-            document=file_buffer,
+            document=export_file,
             caption=f"✅ <b>Your Activity Export</b>\n\n📊 Total logs: {len(logs)}\n📅 Export date: {datetime.utcnow().strftime('%Y-%m-%d %H:%M')}"
         )
         
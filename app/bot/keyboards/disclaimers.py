@@ -3,15 +3,19 @@ Legal Disclaimers
 Privacy notices and legal warnings for sensitive modules
 """
 
-from aiogram.types import InlineKeyboardButton
+from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 from aiogram.utils.keyboard import InlineKeyboardBuilder
 
 
+# Shared footer for legal texts - update the date in one place
+LEGAL_FOOTER = "<i>Last updated: February 2026</i>"
+
+
 # ============================================
 # OSINT TOOLS DISCLAIMER
 # ============================================
 
-OSINT_DISCLAIMER_TEXT = """
+OSINT_DISCLAIMER_TEXT = f"""
 ⚠️ <b>OSINT Tools - Legal Disclaimer</b>
 
 <b>IMPORTANT LEGAL NOTICE:</b>
@@ -56,12 +60,12 @@ By using these OSINT (Open Source Intelligence) tools, you agree to the followin
 3. Accept full responsibility for your actions
 4. Will not use for malicious purposes
 
-<i>Last updated: February 2026</i>
-"""
+{LEGAL_FOOTER}
+""".strip()
 
 
-def get_osint_disclaimer_keyboard():
-    """Get OSINT disclaimer keyboard"""
+def _build_osint_disclaimer_keyboard() -> InlineKeyboardMarkup:
+    """Build OSINT disclaimer keyboard"""
     builder = InlineKeyboardBuilder()
     builder.row(
         InlineKeyboardButton(text="✅ I Agree - Continue", callback_data="osint_agree"),
@@ -70,6 +74,15 @@ def get_osint_disclaimer_keyboard():
     return builder.as_markup()
 
 
+# Static keyboard - built once at import
+_OSINT_DISCLAIMER_KEYBOARD = _build_osint_disclaimer_keyboard()
+
+
+def get_osint_disclaimer_keyboard() -> InlineKeyboardMarkup:
+    """Get OSINT disclaimer keyboard"""
+    return _OSINT_DISCLAIMER_KEYBOARD
+
+
 # ============================================
 # BREACH CHECK DISCLAIMER
 # ============================================
@@ -127,11 +140,11 @@ We take your privacy seriously:
 This tool is for security awareness only. We are not responsible for how you use the information provided.
 
 <i>Powered by HaveIBeenPwned API</i>
-"""
+""".strip()
 
 
-def get_breach_disclaimer_keyboard():
-    """Get breach check disclaimer keyboard"""
+def _build_breach_disclaimer_keyboard() -> InlineKeyboardMarkup:
+    """Build breach check disclaimer keyboard"""
     builder = InlineKeyboardBuilder()
     builder.row(
         InlineKeyboardButton(text="✅ I Understand - Check Email", callback_data="breach_agree"),
@@ -141,11 +154,20 @@ def get_breach_disclaimer_keyboard():
     return builder.as_markup()
 
 
+# Static keyboard - built once at import
+_BREACH_DISCLAIMER_KEYBOARD = _build_breach_disclaimer_keyboard()
+
+
+def get_breach_disclaimer_keyboard() -> InlineKeyboardMarkup:
+    """Get breach check disclaimer keyboard"""
+    return _BREACH_DISCLAIMER_KEYBOARD
+
+
 # ============================================
 # GENERAL DATA POLICY
 # ============================================
 
-DATA_USAGE_POLICY = """
+DATA_USAGE_POLICY = f"""
 📋 <b>Data Usage Policy</b>
 
 <b>What Data We Collect:</b>
@@ -190,8 +212,8 @@ DATA_USAGE_POLICY = """
 <b>Contact:</b>
 For privacy concerns or data requests, contact the bot administrator.
 
-<i>Last updated: February 2026</i>
-"""
+{LEGAL_FOOTER}
+""".strip()
 
 
 # ============================================
@@ -241,13 +263,22 @@ AI_DISCLAIMER_TEXT = """
 • DALL-E (OpenAI)
 
 <i>AI is a tool, not a replacement for human judgment.</i>
-"""
+""".strip()
 
 
 # ============================================
 # HELPER FUNCTIONS
 # ============================================
 
+# Module identifier -> (disclaimer_text, keyboard), resolved once at import
+_DISCLAIMERS = {
+    'osint': (OSINT_DISCLAIMER_TEXT, _OSINT_DISCLAIMER_KEYBOARD),
+    'breach': (BREACH_DISCLAIMER_TEXT, _BREACH_DISCLAIMER_KEYBOARD),
+    'ai': (AI_DISCLAIMER_TEXT, None),
+    'data_policy': (DATA_USAGE_POLICY, None)
+}
+
+
 def get_disclaimer_for_module(module_name: str) -> tuple[str, any]:
     """
     Get disclaimer text and keyboard for a module
@@ -258,11 +289,4 @@ def get_disclaimer_for_module(module_name: str) -> tuple[str, any]:
     Returns:
         Tuple of (disclaimer_text, keyboard)
     """
-    disclaimers = {
-        'osint': (OSINT_DISCLAIMER_TEXT, get_osint_disclaimer_keyboard()),
-        'breach': (BREACH_DISCLAIMER_TEXT, get_breach_disclaimer_keyboard()),
-        'ai': (AI_DISCLAIMER_TEXT, None),
-        'data_policy': (DATA_USAGE_POLICY, None)
-    }
-    
-    return disclaimers.get(module_name, (None, None))
+    return _DISCLAIMERS.get(module_name, (None, None))
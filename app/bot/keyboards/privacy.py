@@ -2,12 +2,12 @@
 Privacy policy keyboard and handler
 """
 
-from aiogram.types import InlineKeyboardButton
+from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 from aiogram.utils.keyboard import InlineKeyboardBuilder
 
 
-def get_privacy_keyboard():
-    """Get privacy policy keyboard"""
+def _build_privacy_keyboard() -> InlineKeyboardMarkup:
+    """Build privacy policy keyboard"""
     builder = InlineKeyboardBuilder()
     
     builder.row(
@@ -20,8 +20,8 @@ def get_privacy_keyboard():
     return builder.as_markup()
 
 
-def get_back_from_privacy_keyboard():
-    """Get back button from privacy policy"""
+def _build_back_from_privacy_keyboard() -> InlineKeyboardMarkup:
+    """Build back button from privacy policy"""
     builder = InlineKeyboardBuilder()
     
     builder.row(
@@ -31,6 +31,21 @@ def get_back_from_privacy_keyboard():
     return builder.as_markup()
 
 
+# Keyboards are static - build once at import and reuse
+_PRIVACY_KEYBOARD = _build_privacy_keyboard()
+_BACK_FROM_PRIVACY_KEYBOARD = _build_back_from_privacy_keyboard()
+
+
+def get_privacy_keyboard() -> InlineKeyboardMarkup:
+    """Get privacy policy keyboard"""
+    return _PRIVACY_KEYBOARD
+
+
+def get_back_from_privacy_keyboard() -> InlineKeyboardMarkup:
+    """Get back button from privacy policy"""
+    return _BACK_FROM_PRIVACY_KEYBOARD
+
+
 # Privacy policy text
 PRIVACY_POLICY_TEXT = """
 🔒 <b>Security & Data Policy</b>
@@ -74,7 +89,7 @@ To protect the platform, detect abuse, and maintain system integrity, this bot s
 /privacy - View this policy
 
 By continuing to use this bot, you acknowledge and accept this data policy.
-"""
+""".strip()
 
 # Security disclaimer for /start
 SECURITY_DISCLAIMER = """
@@ -86,4 +101,4 @@ For security and abuse-prevention purposes, this bot stores:
 • Module usage logs
 
 Your data is secure and never shared. See /privacy for details.
-"""
+""".strip()
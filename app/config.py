@@ -3,70 +3,106 @@ Configuration Management for EverythingInBot
 Loads environment variables and provides app-wide settings
 """
 
+import json
 import os
-from pydantic_settings import BaseSettings
+from functools import cache
+from dataclasses import dataclass, fields
 from typing import Optional
 
+from dotenv import load_dotenv
+
+# Load .env once (existing environment variables take precedence)
+load_dotenv()
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """Application Settings (read from the environment once at import)"""
 
-class Settings(BaseSettings):
-    """Application Settings"""
-    
     # Environment
-    ENVIRONMENT: str = os.getenv("ENVIRONMENT", "development")
-    
+    ENVIRONMENT: str = "development"
+
     # Telegram Bot
-    TELEGRAM_BOT_TOKEN: str = os.getenv("TELEGRAM_BOT_TOKEN", "")
-    TELEGRAM_WEBHOOK_SECRET: str = os.getenv("TELEGRAM_WEBHOOK_SECRET", "")
+    TELEGRAM_BOT_TOKEN: str = ""
+    TELEGRAM_WEBHOOK_SECRET: str = ""
     TELEGRAM_WEBHOOK_PATH: str = "/webhook"
-    
+    WEBHOOK_MAX_CONNECTIONS: int = 100  # Telegram's maximum (default is 40)
+
     # Database
-    MONGODB_URI: str = os.getenv("MONGODB_URI", "")
-    REDIS_URL: str = os.getenv("REDIS_URL", "")
-    
+    MONGODB_URI: str = ""
+    REDIS_URL: str = ""
+
     # AI Services
-    OPENAI_API_KEY: Optional[str] = os.getenv("OPENAI_API_KEY")
-    ANTHROPIC_API_KEY: Optional[str] = os.getenv("ANTHROPIC_API_KEY")
-    GOOGLE_AI_API_KEY: Optional[str] = os.getenv("GOOGLE_AI_API_KEY")
-    OLLAMA_BASE_URL: str = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
-    
+    OPENAI_API_KEY: Optional[str] = None
+    ANTHROPIC_API_KEY: Optional[str] = None
+    GOOGLE_AI_API_KEY: Optional[str] = None
+    OLLAMA_BASE_URL: str = "http://localhost:11434"
+
     # Breach Check
-    XPOSEDORNOT_API_KEY: Optional[str] = os.getenv("XPOSEDORNOT_API_KEY")
-    
+    XPOSEDORNOT_API_KEY: Optional[str] = None
+
     # Payment Gateways
-    RAZORPAY_KEY_ID: Optional[str] = os.getenv("RAZORPAY_KEY_ID")
-    RAZORPAY_KEY_SECRET: Optional[str] = os.getenv("RAZORPAY_KEY_SECRET")
-    STRIPE_API_KEY: Optional[str] = os.getenv("STRIPE_API_KEY")
-    
+    RAZORPAY_KEY_ID: Optional[str] = None
+    RAZORPAY_KEY_SECRET: Optional[str] = None
+    STRIPE_API_KEY: Optional[str] = None
+
     # Security
-    JWT_SECRET_KEY: str = os.getenv("JWT_SECRET_KEY", "change-me-in-production")
+    JWT_SECRET_KEY: str = "change-me-in-production"
     JWT_ALGORITHM: str = "HS256"
     JWT_EXPIRATION_HOURS: int = 24
-    
+
     # Rate Limiting
     RATE_LIMIT_GUEST: int = 1  # requests per day
     RATE_LIMIT_FREE: int = 5   # requests per day
     RATE_LIMIT_PRO: int = -1   # unlimited
-    
+
     # File Upload
     MAX_FILE_SIZE_MB: int = 50
-    ALLOWED_IMAGE_TYPES: list = ["image/jpeg", "image/png", "image/webp"]
-    ALLOWED_DOCUMENT_TYPES: list = ["application/pdf", "application/msword"]
-    
-    # Celery
-    CELERY_BROKER_URL: str = os.getenv("REDIS_URL", "")
-    CELERY_RESULT_BACKEND: str = os.getenv("REDIS_URL", "")
-    
-    class Config:
-        env_file = ".env"
-        case_sensitive = True
+    ALLOWED_IMAGE_TYPES: frozenset = frozenset({"image/jpeg", "image/png", "image/webp"})
+    ALLOWED_DOCUMENT_TYPES: frozenset = frozenset({"application/pdf", "application/msword"})
+
+    # Celery (falls back to REDIS_URL)
+    CELERY_BROKER_URL: str = ""
+    CELERY_RESULT_BACKEND: str = ""
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        """
+        Build settings from environment variables
+
+        Only variables that are set override the defaults. Integers are
+        converted with int() and sets are parsed from JSON arrays.
+        """
+        fallbacks = {
+            "CELERY_BROKER_URL": "REDIS_URL",
+            "CELERY_RESULT_BACKEND": "REDIS_URL",
+        }
+
+        values = {}
+        for f in fields(cls):
+            raw = os.getenv(f.name)
+            if raw is None and f.name in fallbacks:
+                raw = os.getenv(fallbacks[f.name])
+            if raw is None:
+                continue
+
+            if f.type is int:
+                values[f.name] = int(raw)
+            elif f.type is frozenset:
+                values[f.name] = frozenset(json.loads(raw))
+            else:
+                values[f.name] = raw
+
+        return cls(**values)
 
 
 # Global settings instance
-settings = Settings()
+settings = Settings.from_env()
 
 
+@cache
 def get_webhook_url() -> str:
-    """Get full webhook URL for Telegram"""
+    """Get full webhook URL for Telegram (computed once per process)"""
     # This will be set as environment variable in Render
     base_url = os.getenv("RENDER_EXTERNAL_URL", "http://localhost:8000")
     return f"{base_url}{settings.TELEGRAM_WEBHOOK_PATH}/{settings.TELEGRAM_BOT_TOKEN}"
@@ -3,21 +3,152 @@ MongoDB Database Connection using Motor (Async Driver)
 Optimized for Render.com deployment with MongoDB Atlas
 """
 
+import asyncio
+import hashlib
 import os
-from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
-from pymongo.errors import ConnectionFailure
-from typing import Optional
+
+import orjson
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase, AsyncIOMotorCollection
+from pymongo import IndexModel, ASCENDING, DESCENDING
+from pymongo.errors import ConnectionFailure, OperationFailure
+from typing import Dict, List, Optional
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+# Index specs per collection (one createIndexes command each)
+INDEX_SPECS: Dict[str, List[IndexModel]] = {
+    # Users collection indexes
+    "users": [
+        IndexModel([("telegram_id", ASCENDING)], unique=True),
+        IndexModel([("tier", ASCENDING)]),
+        IndexModel([("created_at", ASCENDING)]),
+    ],
+
+    # Subscriptions collection indexes
+    "subscriptions": [
+        IndexModel([("user_id", ASCENDING), ("status", ASCENDING)]),
+        IndexModel([("expires_at", ASCENDING)]),
+    ],
+
+    # User progress collection indexes
+    "user_progress": [
+        IndexModel([("user_id", ASCENDING), ("course_id", ASCENDING)], unique=True),
+    ],
+
+    # Tool usage collection indexes
+    "tool_usage": [
+        IndexModel([("user_id", ASCENDING), ("tool_name", ASCENDING)]),
+        IndexModel([("timestamp", ASCENDING)]),
+    ],
+
+    # OSINT history indexes
+    "osint_history": [
+        IndexModel([("user_id", ASCENDING)]),
+        IndexModel([("timestamp", ASCENDING)]),
+    ],
+
+    # Breach checks indexes
+    "breach_checks": [
+        IndexModel([("user_id", ASCENDING)]),
+        IndexModel([("email", ASCENDING)]),
+    ],
+
+    # Analytics indexes
+    "analytics": [
+        IndexModel([("event_type", ASCENDING)]),
+        IndexModel([("timestamp", ASCENDING)]),
+    ],
+
+    # Search logs indexes (NEW - for logging system)
+    "search_logs": [
+        IndexModel([("telegram_id", ASCENDING)]),
+        IndexModel([("timestamp", ASCENDING)]),
+        IndexModel([("module_name", ASCENDING)]),
+        IndexModel([("telegram_id", ASCENDING), ("timestamp", DESCENDING)]),
+        IndexModel([("telegram_id", ASCENDING), ("module_name", ASCENDING)]),
+    ],
+
+    # Jobs collection indexes (automated job fetching + browsing)
+    "jobs": [
+        IndexModel([("hash", ASCENDING)], unique=True),  # Deduplication
+        IndexModel([("expires_at", ASCENDING)], expireAfterSeconds=0),  # TTL index (24 hours)
+        IndexModel([("category", ASCENDING)]),
+        IndexModel([("country", ASCENDING)]),
+        IndexModel([("type", ASCENDING)]),
+        IndexModel([("active", ASCENDING)]),
+        IndexModel([("posted_at", DESCENDING)]),  # Latest first
+        IndexModel([("category", ASCENDING), ("country", ASCENDING)]),
+        IndexModel([("category", ASCENDING), ("location", ASCENDING)]),
+    ],
+
+    # Courses collection indexes (automated course fetching + browsing)
+    "courses": [
+        IndexModel([("hash", ASCENDING)], unique=True),  # Deduplication
+        IndexModel([("expires_at", ASCENDING)], expireAfterSeconds=0),  # TTL index (48 hours)
+        IndexModel([("category", ASCENDING)]),
+        IndexModel([("platform", ASCENDING)]),
+        IndexModel([("difficulty", ASCENDING)]),
+        IndexModel([("language", ASCENDING)]),
+        IndexModel([("published", ASCENDING)]),
+        IndexModel([("category", ASCENDING), ("platform", ASCENDING)]),
+        IndexModel([("category", ASCENDING), ("published", ASCENDING)]),
+    ],
+}
+
+
+# Collections with a get_*_collection shortcut (handles cached on connect)
+CACHED_COLLECTIONS = (
+    "users",
+    "subscriptions",
+    "courses",
+    "jobs",
+    "tool_usage",
+    "analytics",
+    "search_logs",
+)
+
+# Document in the _meta collection holding the fingerprint of INDEX_SPECS
+INDEX_VERSION_ID = "index_version"
+
+
+def index_specs_fingerprint() -> str:
+    """
+    Fingerprint of INDEX_SPECS, changes whenever an index spec changes
+    
+    Returns:
+        SHA-1 hex digest of the serialized specs
+    """
+    specs = {
+        name: [
+            # Keep compound key order explicit (name already encodes it)
+            {**model.document, "key": list(model.document["key"].items())}
+            for model in models
+        ]
+        for name, models in INDEX_SPECS.items()
+    }
+    payload = orjson.dumps(specs, option=orjson.OPT_SORT_KEYS, default=str)
+    return hashlib.sha1(payload).hexdigest()
+
+
+class _DBState:
+    """Connection state shared by Database (slotted for fixed attribute access)"""
+    
+    __slots__ = ("client", "db", "collections")
+    
+    def __init__(self):
+        self.client: Optional[AsyncIOMotorClient] = None
+        self.db: Optional[AsyncIOMotorDatabase] = None
+        self.collections: Dict[str, AsyncIOMotorCollection] = {}
+
+
+_state = _DBState()
+
+
 class Database:
     """MongoDB Database Manager using Motor"""
     
-    client: Optional[AsyncIOMotorClient] = None
-    db: Optional[AsyncIOMotorDatabase] = None
-    
     @classmethod
     async def connect_db(cls):
         """Connect to MongoDB Atlas"""
@@ -27,10 +158,13 @@ class Database:
                 raise ValueError("MONGODB_URI environment variable not set")
             
             # Create async MongoDB client
-            cls.client = AsyncIOMotorClient(
+            # Wire compression: zstd when the server supports it, zlib otherwise
+            _state.client = AsyncIOMotorClient(
                 mongodb_uri,
                 maxPoolSize=10,
-                minPoolSize=1,
+                minPoolSize=3,  # Keep warm connections for webhook bursts
+                maxIdleTimeMS=60000,
+                compressors="zstd,zlib",
                 serverSelectionTimeoutMS=5000,
                 connectTimeoutMS=10000,
                 retryWrites=True,
@@ -38,10 +172,13 @@ class Database:
             )
             
             # Get database
-            cls.db = cls.client.everythinginbot
+            _state.db = _state.client.everythinginbot
+            
+            # Resolve collection handles once for the get_*_collection shortcuts
+            _state.collections = {name: _state.db[name] for name in CACHED_COLLECTIONS}
             
             # Test connection
-            await cls.client.admin.command('ping')
+            await _state.client.admin.command('ping')
             logger.info("✅ Connected to MongoDB Atlas successfully")
             
             # Create indexes
@@ -57,137 +194,104 @@ class Database:
     @classmethod
     async def close_db(cls):
         """Close MongoDB connection"""
-        if cls.client:
-            cls.client.close()
+        if _state.client:
+            _state.client.close()
             logger.info("MongoDB connection closed")
     
     @classmethod
     async def create_indexes(cls):
-        """Create database indexes for performance"""
-        try:
-            # Users collection indexes
-            await cls.db.users.create_index("telegram_id", unique=True)
-            await cls.db.users.create_index("tier")
-            await cls.db.users.create_index("created_at")
-            
-            # Subscriptions collection indexes
-            await cls.db.subscriptions.create_index([("user_id", 1), ("status", 1)])
-            await cls.db.subscriptions.create_index("expires_at")
-            
-            # Courses collection indexes
-            await cls.db.courses.create_index("category")
-            await cls.db.courses.create_index("published")
-            await cls.db.courses.create_index([("category", 1), ("published", 1)])
-            
-            # Jobs collection indexes
-            await cls.db.jobs.create_index([("category", 1), ("location", 1)])
-            await cls.db.jobs.create_index("posted_at")
-            await cls.db.jobs.create_index("active")
-            
-            # User progress collection indexes
-            await cls.db.user_progress.create_index(
-                [("user_id", 1), ("course_id", 1)], 
-                unique=True
-            )
-            
-            # Tool usage collection indexes
-            await cls.db.tool_usage.create_index([("user_id", 1), ("tool_name", 1)])
-            await cls.db.tool_usage.create_index("timestamp")
-            
-            # OSINT history indexes
-            await cls.db.osint_history.create_index("user_id")
-            await cls.db.osint_history.create_index("timestamp")
-            
-            # Breach checks indexes
-            await cls.db.breach_checks.create_index("user_id")
-            await cls.db.breach_checks.create_index("email")
-            
-            # Analytics indexes
-            await cls.db.analytics.create_index("event_type")
-            await cls.db.analytics.create_index("timestamp")
-            
-            # Search logs indexes (NEW - for logging system)
-            await cls.db.search_logs.create_index("telegram_id")
-            await cls.db.search_logs.create_index("timestamp")
-            await cls.db.search_logs.create_index("module_name")
-            await cls.db.search_logs.create_index([("telegram_id", 1), ("timestamp", -1)])
-            await cls.db.search_logs.create_index([("telegram_id", 1), ("module_name", 1)])
-            
-            # Jobs collection indexes (NEW - for automated job fetching)
-            await cls.db.jobs.create_index("hash", unique=True)  # Deduplication
-            await cls.db.jobs.create_index("expires_at", expireAfterSeconds=0)  # TTL index (24 hours)
-            await cls.db.jobs.create_index("category")
-            await cls.db.jobs.create_index("country")
-            await cls.db.jobs.create_index("type")
-            await cls.db.jobs.create_index([("posted_at", -1)])  # Latest first
-            await cls.db.jobs.create_index([("category", 1), ("country", 1)])
-            
-            # Courses collection indexes (NEW - for automated course fetching)
-            await cls.db.courses.create_index("hash", unique=True)  # Deduplication
-            await cls.db.courses.create_index("expires_at", expireAfterSeconds=0)  # TTL index (48 hours)
-            await cls.db.courses.create_index("category")
-            await cls.db.courses.create_index("platform")
-            await cls.db.courses.create_index("difficulty")
-            await cls.db.courses.create_index("language")
-            await cls.db.courses.create_index([("category", 1), ("platform", 1)])
-            
-            logger.info("✅ Database indexes created successfully")
-            
-        except Exception as e:
-            logger.error(f"❌ Error creating indexes: {e}")
-            # Don't raise - indexes are optimization, not critical
+        """
+        Create database indexes for performance
+        
+        Skipped when the fingerprint stored in _meta matches INDEX_SPECS,
+        so warm restarts don't pay a round-trip per collection.
+        
+        A rejected index spec (OperationFailure) only skips that collection -
+        indexes are optimization, not critical. Anything else (network, auth)
+        is raised so connect_db fails fast.
+        """
+        fingerprint = index_specs_fingerprint()
+        current = await _state.db["_meta"].find_one({"_id": INDEX_VERSION_ID})
+        if current and current.get("hash") == fingerprint:
+            logger.info("✅ Database indexes up to date")
+            return
+        
+        # Collections are independent - create their indexes concurrently
+        names = list(INDEX_SPECS)
+        results = await asyncio.gather(
+            *(_state.db[name].create_indexes(INDEX_SPECS[name]) for name in names),
+            return_exceptions=True
+        )
+        
+        failed = 0
+        for name, result in zip(names, results):
+            if isinstance(result, OperationFailure):
+                failed += 1
+                logger.warning(f"⚠️ Index creation failed on {name}: {result}")
+            elif isinstance(result, BaseException):
+                raise result
+        
+        if failed:
+            logger.warning(f"⚠️ Indexes created with {failed}/{len(names)} collection failures")
+            return
+        
+        # Only record the fingerprint once every collection succeeded
+        await _state.db["_meta"].update_one(
+            {"_id": INDEX_VERSION_ID},
+            {"$set": {"hash": fingerprint}},
+            upsert=True
+        )
+        
+        logger.info("✅ Database indexes created successfully")
+    
+    @classmethod
+    def get_collection(cls, name: str) -> AsyncIOMotorCollection:
+        """Get a cached collection handle"""
+        collection = _state.collections.get(name)
+        if collection is None:
+            raise RuntimeError("Database not initialized. Call connect_db() first.")
+        return collection
     
     @classmethod
     def get_db(cls) -> AsyncIOMotorDatabase:
         """Get database instance"""
-        if cls.db is None:
+        db = _state.db
+        if db is None:
             raise RuntimeError("Database not initialized. Call connect_db() first.")
-        return cls.db
-
-
-# Convenience function for FastAPI dependency injection
-async def get_database() -> AsyncIOMotorDatabase:
-    """FastAPI dependency to get database"""
-    return Database.get_db()
+        return db
 
 
 # Collection shortcuts
 def get_users_collection():
     """Get users collection"""
-    return Database.get_db().users
+    return Database.get_collection("users")
 
 
 def get_subscriptions_collection():
     """Get subscriptions collection"""
-    return Database.get_db().subscriptions
+    return Database.get_collection("subscriptions")
 
 
 def get_courses_collection():
     """Get courses collection"""
-    return Database.get_db().courses
+    return Database.get_collection("courses")
 
 
 def get_jobs_collection():
     """Get jobs collection"""
-    return Database.get_db().jobs
+    return Database.get_collection("jobs")
 
 
 def get_tool_usage_collection():
     """Get tool usage collection"""
-    return Database.get_db().tool_usage
+    return Database.get_collection("tool_usage")
 
 
 def get_analytics_collection():
     """Get analytics collection"""
-    return Database.get_db().analytics
+    return Database.get_collection("analytics")
 
 
 def get_search_logs_collection():
     """Get search logs collection"""
-    return Database.get_db().search_logs
-
-
-# Alias for backward compatibility
-async def get_db() -> AsyncIOMotorDatabase:
-    """Get database instance (async alias)"""
-    return Database.get_db()
+    return Database.get_collection("search_logs")
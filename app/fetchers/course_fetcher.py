@@ -1,11 +1,12 @@
 """
 Course Fetcher
-Automated course fetching from 6 public platforms
+Automated course fetching from 5 public platforms
 """
 
 import asyncio
 import logging
 import os
+import re
 from typing import List, Dict, Any, Optional
 
 from app.fetchers.utils import fetch_json, fetch_rss
@@ -14,100 +15,63 @@ from app.utils.deduplication import generate_course_hash
 
 logger = logging.getLogger(__name__)
 
+# Title filters for blog-style feeds (case-insensitive substring match)
+_CLASSCENTRAL_FILTER = re.compile(r'course|learn|tutorial|class|training', re.IGNORECASE)
+_FREECODECAMP_FILTER = re.compile(r'course|tutorial|learn|guide|bootcamp', re.IGNORECASE)
+
+
+def _first_dict(items: Any) -> Dict[str, Any]:
+    """First element of an API list if it is an object, else an empty dict"""
+    if isinstance(items, list) and items and isinstance(items[0], dict):
+        return items[0]
+    return {}
+
+
+def _dict_field(data: Dict[str, Any], key: str) -> Dict[str, Any]:
+    """Nested API object, or an empty dict when missing or of another type"""
+    value = data.get(key)
+    return value if isinstance(value, dict) else {}
+
 
 # ============================================
 # COURSE SOURCES
 # ============================================
+# Each source is split into a raw fetch (network only, returns the list of
+# raw entries) and a pure mapper (raw entry -> course fields, or None to
+# skip). fetch_all_courses normalizes and hashes all sources in one pass.
 
-async def fetch_classcentral() -> List[Dict[str, Any]]:
+async def _raw_classcentral() -> List[Dict[str, Any]]:
     """
-    Fetch courses from ClassCentral RSS
+    Fetch ClassCentral RSS entries
     URL: https://www.classcentral.com/report/feed/
     """
-    logger.info("Fetching courses from ClassCentral...")
-    
     url = "https://www.classcentral.com/report/feed/"
     entries = await fetch_rss(url)
-    
-    if not entries:
-        logger.warning("No courses found from ClassCentral")
-        return []
-    
-    courses = []
-    for entry in entries[:30]:
-        try:
-            # Extract course info from RSS entry
-            title = entry.get('title', '')
-            
-            # Filter for course-related content
-            if not any(word in title.lower() for word in ['course', 'learn', 'tutorial', 'class', 'training']):
-                continue
-            
-            normalized = normalize_course_data(
-                {
-                    'title': title,
-                    'platform': 'classcentral',
-                    'description': entry.get('summary', '')[:500],
-                    'url': entry.get('link'),
-                    'category': 'general'
-                },
-                source='classcentral'
-            )
-            
-            normalized['hash'] = generate_course_hash(
-                normalized['title'],
-                normalized['platform']
-            )
-            
-            courses.append(normalized)
-        except Exception as e:
-            logger.error(f"Error normalizing ClassCentral course: {e}")
-    
-    logger.info(f"Fetched {len(courses)} courses from ClassCentral")
-    return courses
+    return entries[:30] if entries else []
 
 
-async def fetch_udemy() -> List[Dict[str, Any]]:
-    """
-    Fetch free courses from Udemy API
-    URL: https://www.udemy.com/api-2.0/courses/?price=price-free&language=en
-    Note: May require API key in production
-    """
-    logger.info("Fetching courses from Udemy...")
-    
-    # Udemy API requires authentication
-    # For now, return empty or use public course search
-    # In production, use Udemy Affiliate API with proper credentials
+def _map_classcentral(entry: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Map a ClassCentral RSS entry to course fields"""
+    title = entry.get('title', '')
     
-    logger.warning("Udemy API requires authentication - skipping for now")
-    return []
+    # Filter for course-related content
+    if not _CLASSCENTRAL_FILTER.search(title):
+        return None
     
-    # Example implementation with API key:
-    # api_key = os.getenv('UDEMY_API_KEY')
-    # if not api_key:
-    #     return []
-    # 
-    # url = "https://www.udemy.com/api-2.0/courses/"
-    # params = {
-    #     'price': 'price-free',
-    #     'language': 'en',
-    #     'page_size': 50
-    # }
-    # headers = {
-    #     'Authorization': f'Bearer {api_key}'
-    # }
-    # 
-    # data = await fetch_json(url, headers=headers, params=params)
-    # ...
-
-
-async def fetch_coursera() -> List[Dict[str, Any]]:
+    return {
+        'title': title,
+        'platform': 'classcentral',
+        'description': (entry.get('summary') or '')[:500],
+        'url': entry.get('link'),
+        'category': 'general'
+    }
+
+
+async def _raw_coursera() -> List[Dict[str, Any]]:
     """
     Fetch courses from Coursera API
     URL: https://www.coursera.org/api/courses.v1
     """
-    logger.info("Fetching courses from Coursera...")
-    
     url = "https://www.coursera.org/api/courses.v1"
     params = {
         'fields': 'name,description,workload,photoUrl,instructors',
@@ -115,223 +79,238 @@ async def fetch_coursera() -> List[Dict[str, Any]]:
     }
     
     data = await fetch_json(url, params=params)
+    return data['elements'] if data and 'elements' in data else []
+
+
+def _map_coursera(course: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Map a Coursera API course to course fields"""
+    # Without a slug the course URL would be broken - skip before normalizing
+    slug = course.get('slug')
+    title = course.get('name')
+    if not slug or not title:
+        return None
     
-    if not data or 'elements' not in data:
-        logger.warning("No courses found from Coursera")
-        return []
-    
-    courses = []
-    for course in data['elements']:
-        try:
-            # Extract instructor names
-            instructors = course.get('instructors', [])
-            instructor_name = instructors[0].get('fullName') if instructors else None
-            
-            normalized = normalize_course_data(
-                {
-                    'title': course.get('name'),
-                    'platform': 'coursera',
-                    'instructor': instructor_name,
-                    'description': course.get('description', '')[:500],
-                    'url': f"https://www.coursera.org/learn/{course.get('slug', '')}",
-                    'thumbnail': course.get('photoUrl'),
-                    'duration': course.get('workload'),
-                    'category': 'general'
-                },
-                source='coursera'
-            )
-            
-            normalized['hash'] = generate_course_hash(
-                normalized['title'],
-                normalized['platform']
-            )
-            
-            courses.append(normalized)
-        except Exception as e:
-            logger.error(f"Error normalizing Coursera course: {e}")
+    # Extract instructor names
+    instructor_name = _first_dict(course.get('instructors')).get('fullName')
     
-    logger.info(f"Fetched {len(courses)} courses from Coursera")
-    return courses
+    return {
+        'title': title,
+        'platform': 'coursera',
+        'instructor': instructor_name,
+        'description': course.get('description'),
+        'url': f"https://www.coursera.org/learn/{slug}",
+        'thumbnail': course.get('photoUrl'),
+        'duration': course.get('workload'),
+        'category': 'general'
+    }
 
 
-async def fetch_edx() -> List[Dict[str, Any]]:
+async def _raw_edx() -> List[Dict[str, Any]]:
     """
     Fetch courses from edX API
     URL: https://www.edx.org/api/catalog/v2/courses
     """
-    logger.info("Fetching courses from edX...")
-    
     url = "https://www.edx.org/api/catalog/v2/courses"
     params = {
         'limit': 50
     }
     
     data = await fetch_json(url, params=params)
+    return data['results'] if data and 'results' in data else []
+
+
+def _map_edx(course: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Map an edX API course to course fields"""
+    # Extract course details
+    first_run = _first_dict(course.get('course_runs'))
     
-    if not data or 'results' not in data:
-        logger.warning("No courses found from edX")
-        return []
-    
-    courses = []
-    for course in data['results']:
-        try:
-            # Extract course details
-            course_runs = course.get('course_runs', [])
-            first_run = course_runs[0] if course_runs else {}
-            
-            normalized = normalize_course_data(
-                {
-                    'title': course.get('title'),
-                    'platform': 'edx',
-                    'instructor': first_run.get('staff', [{}])[0].get('name') if first_run.get('staff') else None,
-                    'description': course.get('short_description', '')[:500],
-                    'url': course.get('marketing_url', ''),
-                    'thumbnail': course.get('image', {}).get('src'),
-                    'difficulty': first_run.get('level_type'),
-                    'category': 'general'
-                },
-                source='edx'
-            )
-            
-            normalized['hash'] = generate_course_hash(
-                normalized['title'],
-                normalized['platform']
-            )
-            
-            courses.append(normalized)
-        except Exception as e:
-            logger.error(f"Error normalizing edX course: {e}")
-    
-    logger.info(f"Fetched {len(courses)} courses from edX")
-    return courses
+    return {
+        'title': course.get('title'),
+        'platform': 'edx',
+        'instructor': _first_dict(first_run.get('staff')).get('name'),
+        'description': course.get('short_description'),
+        'url': course.get('marketing_url', ''),
+        'thumbnail': _dict_field(course, 'image').get('src'),
+        'difficulty': first_run.get('level_type'),
+        'category': 'general'
+    }
 
 
-async def fetch_freecodecamp() -> List[Dict[str, Any]]:
+async def _raw_freecodecamp() -> List[Dict[str, Any]]:
     """
-    Fetch courses from freeCodeCamp RSS
+    Fetch freeCodeCamp RSS entries
     URL: https://www.freecodecamp.org/news/rss/
     """
-    logger.info("Fetching courses from freeCodeCamp...")
-    
     url = "https://www.freecodecamp.org/news/rss/"
     entries = await fetch_rss(url)
+    return entries[:30] if entries else []
+
+
+def _map_freecodecamp(entry: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Map a freeCodeCamp RSS entry to course fields"""
+    title = entry.get('title', '')
     
-    if not entries:
-        logger.warning("No courses found from freeCodeCamp")
-        return []
-    
-    courses = []
-    for entry in entries[:30]:
-        try:
-            title = entry.get('title', '')
-            
-            # Filter for tutorial/course content
-            if not any(word in title.lower() for word in ['course', 'tutorial', 'learn', 'guide', 'bootcamp']):
-                continue
-            
-            normalized = normalize_course_data(
-                {
-                    'title': title,
-                    'platform': 'freecodecamp',
-                    'instructor': entry.get('author', 'freeCodeCamp'),
-                    'description': entry.get('summary', '')[:500],
-                    'url': entry.get('link'),
-                    'category': 'general'
-                },
-                source='freecodecamp'
-            )
-            
-            normalized['hash'] = generate_course_hash(
-                normalized['title'],
-                normalized['platform']
-            )
-            
-            courses.append(normalized)
-        except Exception as e:
-            logger.error(f"Error normalizing freeCodeCamp course: {e}")
+    # Filter for tutorial/course content
+    if not _FREECODECAMP_FILTER.search(title):
+        return None
     
-    logger.info(f"Fetched {len(courses)} courses from freeCodeCamp")
-    return courses
+    return {
+        'title': title,
+        'platform': 'freecodecamp',
+        'instructor': entry.get('author', 'freeCodeCamp'),
+        'description': (entry.get('summary') or '')[:500],
+        'url': entry.get('link'),
+        'category': 'general'
+    }
+
+
+_YOUTUBE_SEARCH_URL = "https://www.googleapis.com/youtube/v3/search"
+
+# Search queries for course playlists
+_YOUTUBE_QUERIES = (
+    "python full course",
+    "web development bootcamp",
+    "cybersecurity tutorial",
+    "machine learning course",
+    "data science tutorial"
+)
+
+# Query-independent search params (q and key are merged in per request)
+_YOUTUBE_BASE_PARAMS = {
+    'part': 'snippet',
+    'type': 'playlist',
+    'maxResults': 5,
+    'videoDuration': 'long',  # Long videos (likely courses)
+    'relevanceLanguage': 'en'
+}
 
 
-async def fetch_youtube_playlists() -> List[Dict[str, Any]]:
+async def _raw_youtube_playlists() -> List[Dict[str, Any]]:
     """
-    Fetch course playlists from YouTube Data API
+    Fetch course playlist search results from YouTube Data API
     Channels: freeCodeCamp, Telusko, Programming with Mosh
     """
-    logger.info("Fetching course playlists from YouTube...")
-    
     api_key = os.getenv('YOUTUBE_API_KEY')
     if not api_key:
         logger.warning("YouTube API key not found - skipping")
         return []
     
-    # Search queries for course playlists
-    queries = [
-        "python full course",
-        "web development bootcamp",
-        "cybersecurity tutorial",
-        "machine learning course",
-        "data science tutorial"
-    ]
+    # Queries are independent - fetch them concurrently
+    results = await asyncio.gather(
+        *(
+            fetch_json(_YOUTUBE_SEARCH_URL, params=_YOUTUBE_BASE_PARAMS | {'q': query, 'key': api_key})
+            for query in _YOUTUBE_QUERIES
+        ),
+        return_exceptions=True
+    )
     
-    courses = []
+    return [
+        item
+        for data in results
+        if not isinstance(data, Exception) and data and 'items' in data
+        for item in data['items']
+    ]
+
+
+def _map_youtube_playlist(item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Map a YouTube playlist search result to course fields"""
+    snippet = _dict_field(item, 'snippet')
+    playlist_id = _dict_field(item, 'id').get('playlistId')
     
-    for query in queries:
-        url = "https://www.googleapis.com/youtube/v3/search"
-        params = {
-            'part': 'snippet',
-            'q': query,
-            'type': 'playlist',
-            'maxResults': 5,
-            'key': api_key,
-            'videoDuration': 'long',  # Long videos (likely courses)
-            'relevanceLanguage': 'en'
-        }
-        
-        data = await fetch_json(url, params=params)
-        
-        if not data or 'items' not in data:
-            continue
-        
-        for item in data['items']:
-            try:
-                snippet = item.get('snippet', {})
-                playlist_id = item.get('id', {}).get('playlistId')
-                
-                if not playlist_id:
-                    continue
-                
-                normalized = normalize_course_data(
-                    {
-                        'title': snippet.get('title'),
-                        'platform': 'youtube',
-                        'instructor': snippet.get('channelTitle'),
-                        'description': snippet.get('description', '')[:500],
-                        'url': f"https://www.youtube.com/playlist?list={playlist_id}",
-                        'thumbnail': snippet.get('thumbnails', {}).get('high', {}).get('url'),
-                        'category': 'general'
-                    },
-                    source='youtube'
-                )
-                
-                normalized['hash'] = generate_course_hash(
-                    normalized['title'],
-                    normalized['platform']
-                )
-                
-                courses.append(normalized)
-            except Exception as e:
-                logger.error(f"Error normalizing YouTube playlist: {e}")
+    if not playlist_id:
+        return None
     
-    logger.info(f"Fetched {len(courses)} course playlists from YouTube")
-    return courses
+    return {
+        'title': snippet.get('title'),
+        'platform': 'youtube',
+        'instructor': snippet.get('channelTitle'),
+        'description': snippet.get('description'),
+        'url': f"https://www.youtube.com/playlist?list={playlist_id}",
+        'thumbnail': _dict_field(_dict_field(snippet, 'thumbnails'), 'high').get('url'),
+        'category': 'general'
+    }
+
+
+# Source table: name (also the normalization source), label for logs,
+# raw fetch coroutine and entry mapper
+COURSE_SOURCES = [
+    {'name': 'classcentral', 'label': 'ClassCentral', 'fetch': _raw_classcentral, 'map': _map_classcentral},
+    {'name': 'coursera', 'label': 'Coursera', 'fetch': _raw_coursera, 'map': _map_coursera},
+    {'name': 'edx', 'label': 'edX', 'fetch': _raw_edx, 'map': _map_edx},
+    {'name': 'freecodecamp', 'label': 'freeCodeCamp', 'fetch': _raw_freecodecamp, 'map': _map_freecodecamp},
+    {'name': 'youtube', 'label': 'YouTube', 'fetch': _raw_youtube_playlists, 'map': _map_youtube_playlist},
+    # Udemy is not fetched: its course API requires Affiliate API credentials
+]
 
 
 # ============================================
 # MAIN FETCHER FUNCTION
 # ============================================
 
+# Per-source time budget (seconds). Every source runs at once - there are
+# only a handful, so no concurrency cap is needed
+COURSE_FETCH_TIMEOUT = 45
+
+
+async def _fetch_source(source: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Run one source's raw fetch under the time budget
+    
+    Failures are logged and turned into an empty result, so one source
+    never cancels the others in the TaskGroup.
+    """
+    try:
+        async with asyncio.timeout(COURSE_FETCH_TIMEOUT):
+            return await source['fetch']()
+    except TimeoutError:
+        logger.error(f"Fetcher timed out ({source['label']}) after {COURSE_FETCH_TIMEOUT}s")
+    except Exception as e:
+        logger.error(f"Fetcher error ({source['label']}): {e}")
+    return []
+
+
+def _map_entry(source: Dict[str, Any], entry: Any) -> Optional[Dict[str, Any]]:
+    """
+    Map one raw entry, skipping it (None) if it is not an object or the
+    mapper fails on it, so a bad entry never drops the whole batch
+    """
+    if not isinstance(entry, dict):
+        return None
+    try:
+        return source['map'](entry)
+    except Exception as e:
+        logger.debug(f"Malformed {source['label']} entry ({e})")
+        return None
+
+
+def _build_courses(source: Dict[str, Any], entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Map and normalize one source's raw entries
+    
+    Args:
+        source: Entry from COURSE_SOURCES
+        entries: Raw entries returned by the source's fetch
+    
+    Returns:
+        List of normalized courses (without hashes)
+    """
+    # Mapper returns None for filtered entries, normalizer for malformed ones
+    mapped = [_map_entry(source, entry) for entry in entries]
+    normalized = [
+        normalize_course_data(data, source=source['name'])
+        for data in mapped
+        if data is not None
+    ]
+    courses = [course for course in normalized if course is not None]
+    
+    skipped = len(normalized) - len(courses)
+    if skipped:
+        logger.warning(f"Skipped {skipped} malformed {source['label']} courses")
+    
+    logger.info(f"Fetched {len(courses)} courses from {source['label']}")
+    return courses
+
+
 async def fetch_all_courses() -> List[Dict[str, Any]]:
     """
     Fetch courses from all platforms concurrently
@@ -341,24 +320,26 @@ async def fetch_all_courses() -> List[Dict[str, Any]]:
     """
     logger.info("Starting course fetch from all platforms...")
     
-    # Fetch from all sources concurrently
-    results = await asyncio.gather(
-        fetch_classcentral(),
-        fetch_udemy(),
-        fetch_coursera(),
-        fetch_edx(),
-        fetch_freecodecamp(),
-        fetch_youtube_playlists(),
-        return_exceptions=True
-    )
+    # Fetch raw entries from all sources concurrently
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(_fetch_source(source)) for source in COURSE_SOURCES]
     
-    # Combine all courses
+    # Map + normalize per source
     all_courses = []
-    for result in results:
-        if isinstance(result, list):
-            all_courses.extend(result)
-        elif isinstance(result, Exception):
-            logger.error(f"Fetcher error: {result}")
+    for source, task in zip(COURSE_SOURCES, tasks):
+        result = task.result()
+        if result:
+            # One guard per source rather than per entry
+            try:
+                all_courses.extend(_build_courses(source, result))
+            except Exception as e:
+                logger.error(f"Error normalizing {source['label']} courses: {e}")
+        else:
+            logger.warning(f"No courses found from {source['label']}")
+    
+    # Single hash pass over every record
+    for course in all_courses:
+        course['hash'] = generate_course_hash(course['title'], course['platform'])
     
     logger.info(f"Total courses fetched: {len(all_courses)}")
     return all_courses
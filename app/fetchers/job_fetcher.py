@@ -5,15 +5,175 @@ Automated job fetching from 12 public sources (global + India)
 
 import asyncio
 import logging
-from typing import List, Dict, Any, Optional
+import re
+from typing import List, Dict, Any, Optional, Callable, Awaitable, Iterable, Union
 from datetime import datetime
-
-from app.fetchers.utils import fetch_json, fetch_rss, fetch_html, parse_html, extract_text_from_html, extract_all_text_from_html
+from urllib.parse import urljoin
+
+from cachetools import TTLCache
+from lxml import etree, html as lxml_html
+
+from app.fetchers.utils import (
+    fetch_json,
+    fetch_json_budget,
+    fetch_rss,
+    fetch_html,
+    extract_text_from_html,
+    extract_all_text_from_html,
+)
 from app.utils.normalization import normalize_job_data
 from app.utils.deduplication import generate_job_hash
 
 logger = logging.getLogger(__name__)
 
+# The Hindu title filter (case-insensitive substring match, like the course filters)
+_JOB_KEYWORDS_RE = re.compile(r'job|recruitment|hiring|vacancy', re.IGNORECASE)
+
+# (url, title) keys of listings stored recently - on a hit the entry is skipped
+# before normalization. The TTL must stay below job expiry (24h) minus the
+# fetch interval (6h), so still-listed jobs are re-upserted before they expire.
+SEEN_TTL_SECONDS = 12 * 3600
+_seen_jobs: TTLCache = TTLCache(maxsize=200_000, ttl=SEEN_TTL_SECONDS)
+
+# Job hash -> seen key of listings built but not yet stored. Keys move to
+# _seen_jobs in mark_jobs_seen once the write succeeded, so a failed upsert
+# doesn't suppress the listing for SEEN_TTL_SECONDS.
+_pending_seen: TTLCache = TTLCache(maxsize=200_000, ttl=SEEN_TTL_SECONDS)
+
+# Returned by _build_job for listings in _seen_jobs
+_ALREADY_SEEN = object()
+
+# Result of _build_job: a job, None (malformed) or _ALREADY_SEEN
+BuildResult = Union[Dict[str, Any], None, object]
+
+
+# ============================================
+# HELPERS
+# ============================================
+
+def _build_job(
+    raw_data: Dict[str, Any],
+    source: str,
+    default_country: str,
+    category: Optional[str] = None
+) -> BuildResult:
+    """
+    Normalize one raw job and attach its dedup hash
+    
+    Args:
+        raw_data: Raw job fields
+        source: Source identifier
+        default_country: Default country if not specified
+        category: Category override (e.g. 'government')
+    
+    Returns:
+        Normalized job, None if the entry is malformed, or the _ALREADY_SEEN
+        sentinel if it was stored within SEEN_TTL_SECONDS
+    """
+    # Listings without a title or link are useless - skip before any work
+    title = raw_data.get('title')
+    url = raw_data.get('url')
+    if not title or not url:
+        return None
+    
+    seen_key = f"{url}\x1f{title}"
+    if seen_key in _seen_jobs:
+        return _ALREADY_SEEN
+    
+    # A bad entry is skipped on its own, never the whole source batch
+    try:
+        normalized = normalize_job_data(raw_data, source=source, default_country=default_country)
+    except Exception as e:
+        logger.debug(f"Malformed {source} entry ({e})")
+        return None
+    if normalized is None:
+        return None
+    
+    if category:
+        normalized['category'] = category
+    normalized['hash'] = generate_job_hash(
+        normalized['title'],
+        normalized['company'],
+        normalized['url']
+    )
+    _pending_seen[normalized['hash']] = seen_key
+    return normalized
+
+
+def mark_jobs_seen(jobs: Iterable[Dict[str, Any]]):
+    """
+    Remember stored jobs so the next fetches skip them
+    
+    Call after the jobs were written to the database.
+    
+    Args:
+        jobs: Stored jobs (as returned by fetch_all_jobs)
+    """
+    for job in jobs:
+        seen_key = _pending_seen.pop(job['hash'], None)
+        if seen_key is not None:
+            _seen_jobs[seen_key] = True
+
+
+def _rss_entry_to_job(
+    entry: Dict[str, Any],
+    source: str,
+    company: str,
+    default_country: str,
+    location: str = 'India',
+    category: Optional[str] = None
+) -> BuildResult:
+    """
+    Build a job from a feed entry of a single-publisher RSS source
+    
+    Args:
+        entry: Entry returned by fetch_rss
+        source: Source identifier
+        company: Fixed company name for the feed
+        default_country: Default country if not specified
+        location: Fixed location for the feed
+        category: Category override (e.g. 'government')
+    
+    Returns:
+        Normalized job, None if the entry is malformed, or _ALREADY_SEEN
+    """
+    return _build_job(
+        {
+            'title': entry.get('title'),
+            'company': company,
+            'location': location,
+            'description': (entry.get('summary') or '')[:500],
+            'url': entry.get('link'),
+            'posted_at': entry.get('published')
+        },
+        source=source,
+        default_country=default_country,
+        category=category
+    )
+
+
+def _keep_valid(candidates: List[BuildResult], label: str) -> List[Dict[str, Any]]:
+    """
+    Drop malformed (None) and already seen jobs, logging how many were skipped
+    
+    Args:
+        candidates: Results of _build_job
+        label: Source name for logs
+    
+    Returns:
+        List of valid jobs
+    """
+    jobs = [job for job in candidates if job is not None and job is not _ALREADY_SEEN]
+    seen = sum(1 for job in candidates if job is _ALREADY_SEEN)
+    
+    skipped = len(candidates) - len(jobs) - seen
+    if skipped:
+        logger.warning(f"Skipped {skipped} malformed {label} entries")
+    if seen:
+        logger.info(f"Skipped {seen} recently fetched {label} entries")
+    
+    return jobs
+
 
 # ============================================
 # GLOBAL JOB SOURCES
@@ -33,34 +193,23 @@ async def fetch_remotive() -> List[Dict[str, Any]]:
         logger.warning("No jobs found from Remotive")
         return []
     
-    jobs = []
-    for job in data['jobs'][:50]:  # Limit to 50 jobs
-        try:
-            normalized = normalize_job_data(
-                {
-                    'title': job.get('title'),
-                    'company': job.get('company_name'),
-                    'location': 'Remote',
-                    'description': job.get('description', '')[:500],
-                    'url': job.get('url'),
-                    'tags': job.get('tags', []),
-                    'posted_at': job.get('publication_date'),
-                    'salary': job.get('salary')
-                },
-                source='remotive',
-                default_country='global'
-            )
-            
-            # Generate hash
-            normalized['hash'] = generate_job_hash(
-                normalized['title'],
-                normalized['company'],
-                normalized['url']
-            )
-            
-            jobs.append(normalized)
-        except Exception as e:
-            logger.error(f"Error normalizing Remotive job: {e}")
+    jobs = _keep_valid([
+        _build_job(
+            {
+                'title': job.get('title'),
+                'company': job.get('company_name'),
+                'location': 'Remote',
+                'description': job.get('description'),
+                'url': job.get('url'),
+                'tags': job.get('tags', []),
+                'posted_at': job.get('publication_date'),
+                'salary': job.get('salary')
+            },
+            source='remotive',
+            default_country='global'
+        ) if isinstance(job, dict) else None
+        for job in data['jobs'][:50]  # Limit to 50 jobs
+    ], 'Remotive')
     
     logger.info(f"Fetched {len(jobs)} jobs from Remotive")
     return jobs
@@ -80,32 +229,22 @@ async def fetch_arbeitnow() -> List[Dict[str, Any]]:
         logger.warning("No jobs found from Arbeitnow")
         return []
     
-    jobs = []
-    for job in data['data'][:50]:
-        try:
-            normalized = normalize_job_data(
-                {
-                    'title': job.get('title'),
-                    'company': job.get('company_name'),
-                    'location': job.get('location', 'Not specified'),
-                    'description': job.get('description', '')[:500],
-                    'url': job.get('url'),
-                    'tags': job.get('tags', []),
-                    'posted_at': job.get('created_at')
-                },
-                source='arbeitnow',
-                default_country='global'
-            )
-            
-            normalized['hash'] = generate_job_hash(
-                normalized['title'],
-                normalized['company'],
-                normalized['url']
-            )
-            
-            jobs.append(normalized)
-        except Exception as e:
-            logger.error(f"Error normalizing Arbeitnow job: {e}")
+    jobs = _keep_valid([
+        _build_job(
+            {
+                'title': job.get('title'),
+                'company': job.get('company_name'),
+                'location': job.get('location', 'Not specified'),
+                'description': job.get('description'),
+                'url': job.get('url'),
+                'tags': job.get('tags', []),
+                'posted_at': job.get('created_at')
+            },
+            source='arbeitnow',
+            default_country='global'
+        ) if isinstance(job, dict) else None
+        for job in data['data'][:50]
+    ], 'Arbeitnow')
     
     logger.info(f"Fetched {len(jobs)} jobs from Arbeitnow")
     return jobs
@@ -125,32 +264,14 @@ async def fetch_us_gov_jobs() -> List[Dict[str, Any]]:
         logger.warning("No jobs found from US Government RSS")
         return []
     
-    jobs = []
-    for entry in entries[:30]:
-        try:
-            normalized = normalize_job_data(
-                {
-                    'title': entry.get('title'),
-                    'company': 'US Government',
-                    'location': entry.get('summary', 'USA'),
-                    'description': entry.get('summary', '')[:500],
-                    'url': entry.get('link'),
-                    'posted_at': entry.get('published')
-                },
-                source='us_gov',
-                default_country='us'
-            )
-            
-            normalized['category'] = 'government'
-            normalized['hash'] = generate_job_hash(
-                normalized['title'],
-                normalized['company'],
-                normalized['url']
-            )
-            
-            jobs.append(normalized)
-        except Exception as e:
-            logger.error(f"Error normalizing US Gov job: {e}")
+    jobs = _keep_valid([
+        _rss_entry_to_job(
+            entry, 'us_gov', 'US Government', 'us',
+            location=entry.get('summary', 'USA'),
+            category='government'
+        )
+        for entry in entries[:30]
+    ], 'US Government')
     
     logger.info(f"Fetched {len(jobs)} jobs from US Government")
     return jobs
@@ -173,6 +294,27 @@ async def fetch_uk_gov_jobs() -> List[Dict[str, Any]]:
     return []
 
 
+def _build_indeed_job(entry: Dict[str, Any]) -> BuildResult:
+    """Build a job from an Indeed RSS entry ("Title - Location" titles)"""
+    # Extract location from title (Indeed format: "Title - Location")
+    head, sep, tail = entry.get('title', '').rpartition(' - ')
+    title = head if sep else tail
+    location = tail if sep else 'Not specified'
+    
+    return _build_job(
+        {
+            'title': title,
+            'company': entry.get('author', 'Unknown'),
+            'location': location,
+            'description': (entry.get('summary') or '')[:500],
+            'url': entry.get('link'),
+            'posted_at': entry.get('published')
+        },
+        source='indeed',
+        default_country='global'
+    )
+
+
 async def fetch_indeed_rss() -> List[Dict[str, Any]]:
     """
     Fetch jobs from Indeed RSS feeds
@@ -188,44 +330,18 @@ async def fetch_indeed_rss() -> List[Dict[str, Any]]:
         "remote+jobs"
     ]
     
-    all_jobs = []
+    # Queries are independent - fetch them concurrently
+    results = await asyncio.gather(
+        *(fetch_rss(f"https://www.indeed.com/rss?q={query}&l=") for query in queries),
+        return_exceptions=True
+    )
     
-    for query in queries:
-        url = f"https://www.indeed.com/rss?q={query}&l="
-        entries = await fetch_rss(url)
-        
-        if not entries:
-            continue
-        
-        for entry in entries[:10]:  # Limit per query
-            try:
-                # Extract location from title (Indeed format: "Title - Location")
-                title_parts = entry.get('title', '').split(' - ')
-                title = title_parts[0] if title_parts else entry.get('title')
-                location = title_parts[1] if len(title_parts) > 1 else 'Not specified'
-                
-                normalized = normalize_job_data(
-                    {
-                        'title': title,
-                        'company': entry.get('author', 'Unknown'),
-                        'location': location,
-                        'description': entry.get('summary', '')[:500],
-                        'url': entry.get('link'),
-                        'posted_at': entry.get('published')
-                    },
-                    source='indeed',
-                    default_country='global'
-                )
-                
-                normalized['hash'] = generate_job_hash(
-                    normalized['title'],
-                    normalized['company'],
-                    normalized['url']
-                )
-                
-                all_jobs.append(normalized)
-            except Exception as e:
-                logger.error(f"Error normalizing Indeed job: {e}")
+    all_jobs = _keep_valid([
+        _build_indeed_job(entry)
+        for entries in results
+        if entries and not isinstance(entries, Exception)
+        for entry in entries[:10]  # Limit per query
+    ], 'Indeed')
     
     logger.info(f"Fetched {len(all_jobs)} jobs from Indeed")
     return all_jobs
@@ -249,32 +365,10 @@ async def fetch_sarkari_exam() -> List[Dict[str, Any]]:
         logger.warning("No jobs found from Sarkari Exam")
         return []
     
-    jobs = []
-    for entry in entries[:30]:
-        try:
-            normalized = normalize_job_data(
-                {
-                    'title': entry.get('title'),
-                    'company': 'Government of India',
-                    'location': 'India',
-                    'description': entry.get('summary', '')[:500],
-                    'url': entry.get('link'),
-                    'posted_at': entry.get('published')
-                },
-                source='sarkari_exam',
-                default_country='india'
-            )
-            
-            normalized['category'] = 'government'
-            normalized['hash'] = generate_job_hash(
-                normalized['title'],
-                normalized['company'],
-                normalized['url']
-            )
-            
-            jobs.append(normalized)
-        except Exception as e:
-            logger.error(f"Error normalizing Sarkari Exam job: {e}")
+    jobs = _keep_valid([
+        _rss_entry_to_job(entry, 'sarkari_exam', 'Government of India', 'india', category='government')
+        for entry in entries[:30]
+    ], 'Sarkari Exam')
     
     logger.info(f"Fetched {len(jobs)} jobs from Sarkari Exam")
     return jobs
@@ -294,31 +388,10 @@ async def fetch_ht_jobs() -> List[Dict[str, Any]]:
         logger.warning("No jobs found from Hindustan Times")
         return []
     
-    jobs = []
-    for entry in entries[:20]:
-        try:
-            normalized = normalize_job_data(
-                {
-                    'title': entry.get('title'),
-                    'company': 'Various',
-                    'location': 'India',
-                    'description': entry.get('summary', '')[:500],
-                    'url': entry.get('link'),
-                    'posted_at': entry.get('published')
-                },
-                source='hindustan_times',
-                default_country='india'
-            )
-            
-            normalized['hash'] = generate_job_hash(
-                normalized['title'],
-                normalized['company'],
-                normalized['url']
-            )
-            
-            jobs.append(normalized)
-        except Exception as e:
-            logger.error(f"Error normalizing HT job: {e}")
+    jobs = _keep_valid([
+        _rss_entry_to_job(entry, 'hindustan_times', 'Various', 'india')
+        for entry in entries[:20]
+    ], 'Hindustan Times')
     
     logger.info(f"Fetched {len(jobs)} jobs from Hindustan Times")
     return jobs
@@ -338,36 +411,12 @@ async def fetch_the_hindu_jobs() -> List[Dict[str, Any]]:
         logger.warning("No jobs found from The Hindu")
         return []
     
-    jobs = []
-    for entry in entries[:15]:
-        try:
-            # Filter for job-related content
-            title = entry.get('title', '')
-            if not any(word in title.lower() for word in ['job', 'recruitment', 'hiring', 'vacancy']):
-                continue
-            
-            normalized = normalize_job_data(
-                {
-                    'title': title,
-                    'company': 'Various',
-                    'location': 'India',
-                    'description': entry.get('summary', '')[:500],
-                    'url': entry.get('link'),
-                    'posted_at': entry.get('published')
-                },
-                source='the_hindu',
-                default_country='india'
-            )
-            
-            normalized['hash'] = generate_job_hash(
-                normalized['title'],
-                normalized['company'],
-                normalized['url']
-            )
-            
-            jobs.append(normalized)
-        except Exception as e:
-            logger.error(f"Error normalizing The Hindu job: {e}")
+    jobs = _keep_valid([
+        _rss_entry_to_job(entry, 'the_hindu', 'Various', 'india')
+        for entry in entries[:15]
+        # Filter for job-related content
+        if _JOB_KEYWORDS_RE.search(entry.get('title', ''))
+    ], 'The Hindu')
     
     logger.info(f"Fetched {len(jobs)} jobs from The Hindu")
     return jobs
@@ -387,32 +436,10 @@ async def fetch_sarkariresultcm() -> List[Dict[str, Any]]:
         logger.warning("No jobs found from SarkariResultCM")
         return []
     
-    jobs = []
-    for entry in entries[:25]:
-        try:
-            normalized = normalize_job_data(
-                {
-                    'title': entry.get('title'),
-                    'company': 'Government of India',
-                    'location': 'India',
-                    'description': entry.get('summary', '')[:500],
-                    'url': entry.get('link'),
-                    'posted_at': entry.get('published')
-                },
-                source='sarkariresultcm',
-                default_country='india'
-            )
-            
-            normalized['category'] = 'government'
-            normalized['hash'] = generate_job_hash(
-                normalized['title'],
-                normalized['company'],
-                normalized['url']
-            )
-            
-            jobs.append(normalized)
-        except Exception as e:
-            logger.error(f"Error normalizing SarkariResultCM job: {e}")
+    jobs = _keep_valid([
+        _rss_entry_to_job(entry, 'sarkariresultcm', 'Government of India', 'india', category='government')
+        for entry in entries[:25]
+    ], 'SarkariResultCM')
     
     logger.info(f"Fetched {len(jobs)} jobs from SarkariResultCM")
     return jobs
@@ -432,37 +459,69 @@ async def fetch_indgovtjobs() -> List[Dict[str, Any]]:
         logger.warning("No jobs found from IndGovtJobs")
         return []
     
-    jobs = []
-    for entry in entries[:25]:
-        try:
-            normalized = normalize_job_data(
-                {
-                    'title': entry.get('title'),
-                    'company': 'Government of India',
-                    'location': 'India',
-                    'description': entry.get('summary', '')[:500],
-                    'url': entry.get('link'),
-                    'posted_at': entry.get('published')
-                },
-                source='indgovtjobs',
-                default_country='india'
-            )
-            
-            normalized['category'] = 'government'
-            normalized['hash'] = generate_job_hash(
-                normalized['title'],
-                normalized['company'],
-                normalized['url']
-            )
-            
-            jobs.append(normalized)
-        except Exception as e:
-            logger.error(f"Error normalizing IndGovtJobs job: {e}")
+    jobs = _keep_valid([
+        _rss_entry_to_job(entry, 'indgovtjobs', 'Government of India', 'india', category='government')
+        for entry in entries[:25]
+    ], 'IndGovtJobs')
     
     logger.info(f"Fetched {len(jobs)} jobs from IndGovtJobs")
     return jobs
 
 
+def _has_class(name: str) -> str:
+    """XPath predicate matching a whole class token (CSS .name semantics)"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+_FJA_BASE = "https://www.freejobalert.com/"
+
+# FreeJobAlert selectors, compiled once (same matches as the former CSS
+# selectors: first hit in document order, first 20 cards)
+_FJA_CARDS_XP = etree.XPath(
+    f"(.//*[{_has_class('job-card')}] | .//*[{_has_class('job-listing')}] | .//article)[position() <= 20]"
+)
+_FJA_TITLE_XP = etree.XPath(f"(.//h2 | .//h3 | .//*[{_has_class('job-title')}] | .//a)[1]")
+_FJA_LINK_XP = etree.XPath("(.//a)[1]")
+_FJA_DESC_XP = etree.XPath(f"(.//p | .//*[{_has_class('description')}] | .//*[{_has_class('summary')}])[1]")
+
+
+def _element_text(elem) -> str:
+    """Concatenated stripped text of an element (like BS4 get_text(strip=True))"""
+    return ''.join(part.strip() for part in elem.itertext())
+
+
+def _build_freejobalert_job(card) -> BuildResult:
+    """Build a job from a FreeJobAlert listing card (None if incomplete)"""
+    # Extract job details
+    title_elems = _FJA_TITLE_XP(card)
+    link_elems = _FJA_LINK_XP(card)
+    desc_elems = _FJA_DESC_XP(card)
+    
+    if not title_elems or not link_elems:
+        return None
+    
+    title = _element_text(title_elems[0])
+    href = link_elems[0].get('href', '')
+    
+    # Make absolute URL (absolute hrefs pass through unchanged)
+    url_link = urljoin(_FJA_BASE, href) if href else ''
+    
+    description = _element_text(desc_elems[0]) if desc_elems else ''
+    
+    return _build_job(
+        {
+            'title': title,
+            'company': 'Government of India',
+            'location': 'India',
+            'description': description[:500],
+            'url': url_link
+        },
+        source='freejobalert',
+        default_country='india',
+        category='government'
+    )
+
+
 async def scrape_freejobalert() -> List[Dict[str, Any]]:
     """
     Scrape jobs from FreeJobAlert (static HTML scraping)
@@ -478,59 +537,19 @@ async def scrape_freejobalert() -> List[Dict[str, Any]]:
         logger.warning("Failed to fetch FreeJobAlert HTML")
         return []
     
-    soup = parse_html(html)
-    if not soup:
-        return []
-    
     jobs = []
     
     try:
         # Find job listings (adjust selectors based on actual HTML structure)
-        job_cards = soup.select('.job-card, .job-listing, article')[:20]
+        root = lxml_html.fromstring(html)
         
-        for card in job_cards:
-            try:
-                # Extract job details
-                title_elem = card.select_one('h2, h3, .job-title, a')
-                link_elem = card.select_one('a')
-                desc_elem = card.select_one('p, .description, .summary')
-                
-                if not title_elem or not link_elem:
-                    continue
-                
-                title = title_elem.get_text(strip=True)
-                url_link = link_elem.get('href', '')
-                
-                # Make absolute URL
-                if url_link and not url_link.startswith('http'):
-                    url_link = f"https://www.freejobalert.com{url_link}"
-                
-                description = desc_elem.get_text(strip=True) if desc_elem else ''
-                
-                normalized = normalize_job_data(
-                    {
-                        'title': title,
-                        'company': 'Government of India',
-                        'location': 'India',
-                        'description': description[:500],
-                        'url': url_link
-                    },
-                    source='freejobalert',
-                    default_country='india'
-                )
-                
-                normalized['category'] = 'government'
-                normalized['hash'] = generate_job_hash(
-                    normalized['title'],
-                    normalized['company'],
-                    normalized['url']
-                )
-                
-                jobs.append(normalized)
-            except Exception as e:
-                logger.error(f"Error parsing FreeJobAlert job card: {e}")
-                continue
-                
+        # Cards without a title or link are layout noise, not malformed jobs
+        jobs = [
+            job
+            for job in map(_build_freejobalert_job, _FJA_CARDS_XP(root))
+            if job is not None and job is not _ALREADY_SEEN
+        ]
+    
     except Exception as e:
         logger.error(f"Error scraping FreeJobAlert: {e}")
     
@@ -552,36 +571,25 @@ async def fetch_aicte_internships() -> List[Dict[str, Any]]:
         logger.warning("No internships found from AICTE")
         return []
     
-    jobs = []
-    
     # Handle different response formats
     internships = data if isinstance(data, list) else data.get('data', [])
     
-    for internship in internships[:30]:
-        try:
-            normalized = normalize_job_data(
-                {
-                    'title': internship.get('title') or internship.get('position'),
-                    'company': internship.get('company') or internship.get('organization'),
-                    'location': internship.get('location', 'India'),
-                    'description': internship.get('description', '')[:500],
-                    'url': internship.get('url') or internship.get('apply_link', ''),
-                    'posted_at': internship.get('posted_date')
-                },
-                source='aicte',
-                default_country='india'
-            )
-            
-            normalized['category'] = 'internship'
-            normalized['hash'] = generate_job_hash(
-                normalized['title'],
-                normalized['company'],
-                normalized['url']
-            )
-            
-            jobs.append(normalized)
-        except Exception as e:
-            logger.error(f"Error normalizing AICTE internship: {e}")
+    jobs = _keep_valid([
+        _build_job(
+            {
+                'title': internship.get('title') or internship.get('position'),
+                'company': internship.get('company') or internship.get('organization'),
+                'location': internship.get('location', 'India'),
+                'description': internship.get('description'),
+                'url': internship.get('url') or internship.get('apply_link', ''),
+                'posted_at': internship.get('posted_date')
+            },
+            source='aicte',
+            default_country='india',
+            category='internship'
+        ) if isinstance(internship, dict) else None
+        for internship in internships[:30]
+    ], 'AICTE')
     
     logger.info(f"Fetched {len(jobs)} internships from AICTE")
     return jobs
@@ -591,38 +599,82 @@ async def fetch_aicte_internships() -> List[Dict[str, Any]]:
 # MAIN FETCHER FUNCTION
 # ============================================
 
-async def fetch_all_jobs() -> List[Dict[str, Any]]:
+# Sources run by fetch_all_jobs (UK Government is not implemented yet)
+JOB_FETCHERS = (
+    fetch_remotive,
+    fetch_arbeitnow,
+    fetch_us_gov_jobs,
+    fetch_indeed_rss,
+    fetch_sarkari_exam,
+    fetch_ht_jobs,
+    fetch_the_hindu_jobs,
+    fetch_sarkariresultcm,
+    fetch_indgovtjobs,
+    scrape_freejobalert,
+    fetch_aicte_internships,
+)
+
+
+# Per-source time budget (seconds) - stragglers are cancelled, not awaited.
+# Covers fetch_json's full retry/backoff run (~35s) plus a few seconds to
+# parse, so a source recovering on its last retry isn't cut off
+JOB_FETCH_TIMEOUT = fetch_json_budget() + 5
+
+
+async def _run_fetcher(fetcher: Callable[[], Awaitable[List[Dict[str, Any]]]]) -> List[Dict[str, Any]]:
+    """
+    Run one source fetcher under the time budget
+    
+    Failures are logged and turned into an empty result, so one source
+    never stalls or breaks the cycle.
+    """
+    try:
+        return await asyncio.wait_for(fetcher(), timeout=JOB_FETCH_TIMEOUT)
+    except TimeoutError:
+        logger.error(f"Fetcher timed out ({fetcher.__name__}) after {JOB_FETCH_TIMEOUT}s")
+    except Exception as e:
+        logger.error(f"Fetcher error ({fetcher.__name__}): {e}")
+    return []
+
+
+async def fetch_all_jobs(
+    on_batch: Optional[Callable[[List[Dict[str, Any]]], Awaitable[None]]] = None
+) -> List[Dict[str, Any]]:
     """
     Fetch jobs from all sources concurrently
     
+    Results are consumed as each source finishes, so a slow feed only
+    delays its own batch.
+    
+    Args:
+        on_batch: Optional coroutine called with each source's jobs as soon
+            as that source completes (e.g. to persist incrementally)
+    
     Returns:
         List of all normalized jobs
     """
     logger.info("Starting job fetch from all sources...")
     
     # Fetch from all sources concurrently
-    results = await asyncio.gather(
-        fetch_remotive(),
-        fetch_arbeitnow(),
-        fetch_us_gov_jobs(),
-        fetch_indeed_rss(),
-        fetch_sarkari_exam(),
-        fetch_ht_jobs(),
-        fetch_the_hindu_jobs(),
-        fetch_sarkariresultcm(),
-        fetch_indgovtjobs(),
-        scrape_freejobalert(),
-        fetch_aicte_internships(),
-        return_exceptions=True
-    )
+    tasks = [asyncio.create_task(_run_fetcher(fetcher)) for fetcher in JOB_FETCHERS]
     
-    # Combine all jobs
+    # Combine jobs in completion order
     all_jobs = []
-    for result in results:
-        if isinstance(result, list):
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            result = await next_done
+            if not result:
+                continue
+            
             all_jobs.extend(result)
-        elif isinstance(result, Exception):
-            logger.error(f"Fetcher error: {result}")
+            if on_batch is not None:
+                await on_batch(result)
+    except BaseException:
+        # on_batch failed (or we were cancelled) - don't leave sources running
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
     
     logger.info(f"Total jobs fetched: {len(all_jobs)}")
     return all_jobs
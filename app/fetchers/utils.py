@@ -5,20 +5,148 @@ Common functions for HTTP requests, RSS parsing, and error handling
 
 import aiohttp
 import asyncio
-import feedparser
 import logging
-from typing import Optional, Dict, Any, List
+import random
+import time
+from io import BytesIO
+from typing import Optional, Dict, Any, List, Tuple, Union
+from urllib.parse import urlencode, urlsplit
+import orjson
 from bs4 import BeautifulSoup
+from lxml import etree
 
 logger = logging.getLogger(__name__)
 
+# Shared HTTP session - keep-alive connections are reused across fetchers
+_session: Optional[aiohttp.ClientSession] = None
+
+# Default headers for every fetch - compressed bodies are decoded by aiohttp
+# (br needs the Brotli package)
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (compatible; EverythingInBot/1.0)',
+    'Accept-Encoding': 'gzip, deflate, br',
+}
+
+
+async def get_session() -> aiohttp.ClientSession:
+    """
+    Get the shared aiohttp session, creating it on first use
+    
+    Returns:
+        Open ClientSession with a pooled connector
+    """
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            headers=DEFAULT_HEADERS,
+            connector=aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=10,
+                keepalive_timeout=75,  # Outlive the gaps between fetcher bursts
+                ttl_dns_cache=300,
+                enable_cleanup_closed=True
+            )
+        )
+    return _session
+
+
+async def close_session():
+    """Close the shared aiohttp session (call on app shutdown)"""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+
+
+# Request key -> (validator headers, last body) for conditional GETs
+# Feeds and APIs rarely change between scheduler runs - a 304 skips the body
+_conditional_cache: Dict[str, Tuple[Dict[str, str], bytes]] = {}
+
+
+def _request_key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """Cache key for a GET request (URL plus sorted query params)"""
+    if not params:
+        return url
+    return f"{url}?{urlencode(sorted(params.items()))}"
+
+
+def _conditional_headers(key: str, headers: Optional[Dict[str, str]] = None) -> Optional[Dict[str, str]]:
+    """Add If-None-Match / If-Modified-Since when a previous response is cached"""
+    cached = _conditional_cache.get(key)
+    if cached is None:
+        return headers
+    return {**(headers or {}), **cached[0]}
+
+
+def _remember_response(key: str, response: aiohttp.ClientResponse, body: bytes):
+    """Keep the body of a response that carries validators for the next GET"""
+    validators = {}
+    if etag := response.headers.get('ETag'):
+        validators['If-None-Match'] = etag
+    if last_modified := response.headers.get('Last-Modified'):
+        validators['If-Modified-Since'] = last_modified
+    
+    if validators:
+        _conditional_cache[key] = (validators, body)
+    else:
+        _conditional_cache.pop(key, None)
+
+
+# Per-host circuit breaker for fetch_json - after CIRCUIT_FAILURE_THRESHOLD
+# consecutive failed calls (retries exhausted on 5xx, timeouts or connection
+# errors; 4xx doesn't count) the host is skipped for CIRCUIT_OPEN_SECONDS
+CIRCUIT_FAILURE_THRESHOLD = 3
+CIRCUIT_OPEN_SECONDS = 300
+_host_failures: Dict[str, int] = {}
+_host_open_until: Dict[str, float] = {}
+
+
+def _record_failure(host: str) -> bool:
+    """
+    Count a failed call against a host
+    
+    Returns:
+        True if the circuit for the host is now open
+    """
+    failures = _host_failures.get(host, 0) + 1
+    if failures < CIRCUIT_FAILURE_THRESHOLD:
+        _host_failures[host] = failures
+        return False
+    
+    _host_failures.pop(host, None)
+    _host_open_until[host] = time.monotonic() + CIRCUIT_OPEN_SECONDS
+    logger.warning(f"Circuit open for {host} - skipping it for {CIRCUIT_OPEN_SECONDS}s")
+    return True
+
+
+# fetch_json defaults: per-request timeout (seconds), attempts, and the
+# largest jitter factor applied to the 2 ** attempt backoff
+FETCH_TIMEOUT = 10
+FETCH_RETRIES = 3
+BACKOFF_MAX_JITTER = 1.5
+
+
+def fetch_json_budget(timeout: float = FETCH_TIMEOUT, retries: int = FETCH_RETRIES) -> float:
+    """
+    Worst-case duration of one fetch_json call (every attempt times out)
+    
+    Args:
+        timeout: Per-request timeout in seconds
+        retries: Number of attempts
+        
+    Returns:
+        Seconds: all attempts plus the longest backoff sleeps between them
+    """
+    backoff = sum((2 ** attempt) * BACKOFF_MAX_JITTER for attempt in range(retries - 1))
+    return retries * timeout + backoff
+
 
 async def fetch_json(
     url: str,
     headers: Optional[Dict[str, str]] = None,
     params: Optional[Dict[str, Any]] = None,
-    timeout: int = 10,
-    retries: int = 3
+    timeout: int = FETCH_TIMEOUT,
+    retries: int = FETCH_RETRIES
 ) -> Optional[Dict[str, Any]]:
     """
     Fetch JSON data from URL with retry logic
@@ -33,32 +161,135 @@ async def fetch_json(
     Returns:
         JSON response or None on failure
     """
+    host = urlsplit(url).netloc
+    if _host_open_until.get(host, 0) > time.monotonic():
+        logger.info(f"Circuit open for {host} - skipping {url}")
+        return None
+    
+    key = _request_key(url, params)
+    
+    # Whether the latest attempt failed in a way that points at the host
+    host_error = False
+    
     for attempt in range(retries):
+        host_error = False
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    url,
-                    headers=headers,
-                    params=params,
-                    timeout=aiohttp.ClientTimeout(total=timeout)
-                ) as response:
-                    if response.status == 200:
-                        return await response.json()
-                    else:
-                        logger.warning(f"HTTP {response.status} for {url}")
+            session = await get_session()
+            async with session.get(
+                url,
+                headers=_conditional_headers(key, headers),
+                params=params,
+                timeout=aiohttp.ClientTimeout(total=timeout)
+            ) as response:
+                if response.status == 200:
+                    body = await response.read()
+                    data = orjson.loads(body)
+                    _remember_response(key, response, body)
+                    _host_failures.pop(host, None)
+                    return data
+                elif response.status == 304 and key in _conditional_cache:
+                    _host_failures.pop(host, None)
+                    return orjson.loads(_conditional_cache[key][1])
+                else:
+                    logger.warning(f"HTTP {response.status} for {url}")
+                    host_error = response.status >= 500
                         
         except asyncio.TimeoutError:
             logger.warning(f"Timeout fetching {url} (attempt {attempt + 1}/{retries})")
+            host_error = True
+        except aiohttp.ClientConnectionError as e:
+            logger.error(f"Connection error fetching {url}: {e}")
+            host_error = True
         except Exception as e:
             logger.error(f"Error fetching {url}: {e}")
         
-        # Exponential backoff
+        # Exponential backoff with jitter (spreads retries from concurrent fetchers)
         if attempt < retries - 1:
-            await asyncio.sleep(2 ** attempt)
+            await asyncio.sleep((2 ** attempt) * (BACKOFF_MAX_JITTER - 1 + random.random()))
     
+    # One failure per exhausted call, so a single bad request can't open the circuit
+    if host_error:
+        _record_failure(host)
     return None
 
 
+# RSS 2.0, RSS 1.0 (RDF) and Atom namespaces
+_ATOM = "{http://www.w3.org/2005/Atom}"
+_RSS1 = "{http://purl.org/rss/1.0/}"
+_DC = "{http://purl.org/dc/elements/1.1/}"
+
+# Feed item elements to stream
+_FEED_ITEM_TAGS = ("item", f"{_RSS1}item", f"{_ATOM}entry")
+
+# Entry field -> child elements to read, first non-empty wins
+_FEED_FIELDS = {
+    'title': ("title", f"{_RSS1}title", f"{_ATOM}title"),
+    'link': ("link", f"{_RSS1}link"),
+    'summary': ("description", f"{_RSS1}description", f"{_ATOM}summary", f"{_ATOM}content"),
+    'author': ("author", f"{_DC}creator", f"{_ATOM}author/{_ATOM}name"),
+    'published': ("pubDate", f"{_DC}date", f"{_ATOM}published", f"{_ATOM}updated"),
+}
+
+
+def _parse_feed_entry(item) -> Dict[str, str]:
+    """
+    Extract the fields fetchers use from one feed item
+    
+    Fields missing from the item are left out, so entry.get(key, default)
+    keeps working as it did with feedparser entries.
+    """
+    entry = {}
+    for field, paths in _FEED_FIELDS.items():
+        for path in paths:
+            text = item.findtext(path)
+            if text and text.strip():
+                entry[field] = text.strip()
+                break
+    
+    # Atom links live in the href attribute
+    if 'link' not in entry:
+        for link in item.iterfind(f"{_ATOM}link"):
+            if link.get('rel', 'alternate') == 'alternate' and link.get('href'):
+                entry['link'] = link.get('href')
+                break
+    
+    return entry
+
+
+def parse_feed(content: bytes) -> List[Dict[str, str]]:
+    """
+    Parse RSS/Atom feed items with lxml
+    
+    Streams the document and frees each item once read, so memory stays
+    bounded on large feeds. Only title, link, summary, author and published
+    are extracted (dates stay raw strings, parsed later by normalization).
+    
+    Args:
+        content: Raw feed bytes (encoding taken from the XML declaration)
+        
+    Returns:
+        List of feed entries
+    """
+    entries = []
+    context = etree.iterparse(
+        BytesIO(content),
+        events=("end",),
+        tag=_FEED_ITEM_TAGS,
+        recover=True,
+        resolve_entities=False,
+        no_network=True
+    )
+    for _, item in context:
+        entries.append(_parse_feed_entry(item))
+        
+        # Drop the parsed item and its already-processed siblings
+        item.clear()
+        while item.getprevious() is not None:
+            del item.getparent()[0]
+    
+    return entries
+
+
 async def fetch_rss(url: str, timeout: int = 10) -> Optional[List[Dict[str, Any]]]:
     """
     Fetch and parse RSS feed
@@ -71,21 +302,32 @@ async def fetch_rss(url: str, timeout: int = 10) -> Optional[List[Dict[str, Any]
         List of feed entries or None on failure
     """
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
-                if response.status == 200:
-                    content = await response.text()
-                    
-                    # Parse RSS in thread pool (feedparser is blocking)
-                    loop = asyncio.get_event_loop()
-                    feed = await loop.run_in_executor(None, feedparser.parse, content)
-                    
-                    if feed.entries:
-                        return [entry for entry in feed.entries]
-                    else:
-                        logger.warning(f"No entries in RSS feed: {url}")
+        session = await get_session()
+        async with session.get(
+            url,
+            headers=_conditional_headers(url),
+            timeout=aiohttp.ClientTimeout(total=timeout)
+        ) as response:
+            if response.status == 304 and url in _conditional_cache:
+                content = _conditional_cache[url][1]
+            elif response.status == 200:
+                content = await response.read()
+                _remember_response(url, response, content)
+            else:
+                content = None
+            
+            if content is not None:
+                # Parse RSS in a thread (XML parsing is blocking; feeds are
+                # small, so a process pool would cost more in pickling and
+                # resident workers than the parse itself)
+                entries = await asyncio.to_thread(parse_feed, content)
+                
+                if entries:
+                    return entries
                 else:
-                    logger.warning(f"HTTP {response.status} for RSS feed: {url}")
+                    logger.warning(f"No entries in RSS feed: {url}")
+            else:
+                logger.warning(f"HTTP {response.status} for RSS feed: {url}")
                     
     except Exception as e:
         logger.error(f"Error fetching RSS {url}: {e}")
@@ -93,28 +335,41 @@ async def fetch_rss(url: str, timeout: int = 10) -> Optional[List[Dict[str, Any]
     return None
 
 
-async def fetch_html(url: str, timeout: int = 10) -> Optional[str]:
+# Cap on downloaded HTML - listing pages only need their first screens of cards
+HTML_MAX_BYTES = 1024 * 1024
+
+
+async def fetch_html(url: str, timeout: int = 10, max_bytes: int = HTML_MAX_BYTES) -> Optional[bytes]:
     """
     Fetch HTML content from URL
     
+    The body is read in chunks and truncated at max_bytes. Raw bytes are
+    returned undecoded - the parser detects the page encoding itself.
+    
     Args:
         url: URL to fetch
         timeout: Request timeout in seconds
+        max_bytes: Stop reading after this many bytes
         
     Returns:
         HTML content or None on failure
     """
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                url,
-                timeout=aiohttp.ClientTimeout(total=timeout),
-                headers={'User-Agent': 'Mozilla/5.0 (compatible; EverythingInBot/1.0)'}
-            ) as response:
-                if response.status == 200:
-                    return await response.text()
-                else:
-                    logger.warning(f"HTTP {response.status} for {url}")
+        session = await get_session()
+        async with session.get(
+            url,
+            timeout=aiohttp.ClientTimeout(total=timeout)
+        ) as response:
+            if response.status == 200:
+                buf = bytearray()
+                async for chunk in response.content.iter_chunked(65536):
+                    buf += chunk
+                    if len(buf) >= max_bytes:
+                        logger.info(f"Truncated HTML from {url} at {max_bytes} bytes")
+                        break
+                return bytes(buf[:max_bytes])
+            else:
+                logger.warning(f"HTTP {response.status} for {url}")
                     
     except Exception as e:
         logger.error(f"Error fetching HTML {url}: {e}")
@@ -122,12 +377,12 @@ async def fetch_html(url: str, timeout: int = 10) -> Optional[str]:
     return None
 
 
-def parse_html(html: str, parser: str = 'lxml') -> Optional[BeautifulSoup]:
+def parse_html(html: Union[str, bytes], parser: str = 'lxml') -> Optional[BeautifulSoup]:
     """
     Parse HTML with BeautifulSoup
     
     Args:
-        html: HTML content
+        html: HTML content (bytes are decoded by the parser)
         parser: Parser to use
         
     Returns:
@@ -4,43 +4,101 @@ FastAPI + Aiogram 3.x Telegram Bot
 """
 
 import asyncio
+import hmac
+import itertools
 import logging
+import logging.handlers
+import queue
+import time
 from contextlib import asynccontextmanager
+from datetime import datetime
 
-from fastapi import FastAPI, Request, Response
+import orjson
+
+from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.routing import Route
 
 from aiogram import Bot
 from aiogram.client.default import DefaultBotProperties
+from aiogram.client.session.aiohttp import AiohttpSession
 from aiogram.enums import ParseMode
+from aiogram.types import Update
 
 from app.config import settings, get_webhook_url
 from app.database import Database
 from app.redis_client import RedisClient
 from app.bot.dispatcher import get_dispatcher
+from app.fetchers.utils import close_session
+from app.scheduler import scheduler
+from app.tasks import run_job_fetcher, run_course_fetcher, run_cleanup
 
 # Configure logging
+# Writes go straight to stderr until the app starts; while it runs, records
+# are queued by the event loop and written by a listener thread, so log I/O
+# never blocks update processing (see _start_log_listener)
+_log_queue = queue.SimpleQueue()
+_log_stream = logging.StreamHandler()
+_log_stream.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+_log_queue_handler = logging.handlers.QueueHandler(_log_queue)
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_stream, respect_handler_level=True)
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    handlers=[_log_stream]
 )
 logger = logging.getLogger(__name__)
 
 
+def _start_log_listener():
+    """Route root logging through the queue and start the writer thread"""
+    root = logging.getLogger()
+    _log_listener.start()
+    root.removeHandler(_log_stream)
+    root.addHandler(_log_queue_handler)
+
+
+def _stop_log_listener():
+    """Flush queued records, stop the writer thread and log directly again"""
+    root = logging.getLogger()
+    root.removeHandler(_log_queue_handler)
+    root.addHandler(_log_stream)
+    _log_listener.stop()
+
+
 # Initialize bot
+# One pooled aiohttp session (keep-alive to api.telegram.org) for every API
+# call; responses are decoded with orjson
 bot = Bot(
     token=settings.TELEGRAM_BOT_TOKEN,
+    session=AiohttpSession(limit=100, json_loads=orjson.loads),
     default=DefaultBotProperties(parse_mode=ParseMode.HTML)
 )
 
 # Get dispatcher
 dp = get_dispatcher()
 
+# Webhook credentials as bytes for constant-time comparison
+_EXPECTED_TOKEN = settings.TELEGRAM_BOT_TOKEN.encode()
+_EXPECTED_SECRET = settings.TELEGRAM_WEBHOOK_SECRET.encode()
+
+# Updates processed at once - the rest wait their turn instead of piling up
+UPDATE_CONCURRENCY = 64
+_update_semaphore = asyncio.Semaphore(UPDATE_CONCURRENCY)
+
+# Strong references to in-flight update tasks (the loop only keeps weak ones)
+_background_tasks: set[asyncio.Task] = set()
+
+# Per-update logs go to DEBUG; every LOG_SAMPLE_EVERY-th update is logged at INFO
+LOG_SAMPLE_EVERY = 64
+_update_counter = itertools.count()
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager"""
     # Startup
+    _start_log_listener()
     logger.info("🚀 Starting EverythingInBot...")
     
     try:
@@ -48,12 +106,18 @@ async def lifespan(app: FastAPI):
         await Database.connect_db()
         await RedisClient.connect_redis()
         
+        # Share the DB handle with handlers via aiogram DI (handler arg `db`)
+        dp["db"] = Database.get_db()
+        
         # Set webhook
         webhook_url = get_webhook_url()
         await bot.set_webhook(
             url=webhook_url,
             secret_token=settings.TELEGRAM_WEBHOOK_SECRET,
-            drop_pending_updates=True
+            drop_pending_updates=True,
+            max_connections=settings.WEBHOOK_MAX_CONNECTIONS,
+            # Only the update types the routers handle (message, callback_query)
+            allowed_updates=dp.resolve_used_update_types()
         )
         logger.info(f"✅ Webhook set to: {webhook_url}")
         
@@ -67,6 +131,7 @@ async def lifespan(app: FastAPI):
         
     except Exception as e:
         logger.error(f"❌ Startup failed: {e}")
+        _stop_log_listener()
         raise
     
     yield
@@ -76,7 +141,6 @@ async def lifespan(app: FastAPI):
     
     try:
         # Stop scheduler
-        from app.scheduler import scheduler
         scheduler.stop()
         
         # Delete webhook
@@ -85,12 +149,16 @@ async def lifespan(app: FastAPI):
         # Close connections
         await Database.close_db()
         await RedisClient.close_redis()
+        await close_session()
         await bot.session.close()
         
         logger.info("✅ Shutdown complete")
         
     except Exception as e:
         logger.error(f"❌ Shutdown error: {e}")
+    
+    # Flush queued log records last
+    _stop_log_listener()
 
 
 async def delayed_scheduler_start():
@@ -101,8 +169,6 @@ async def delayed_scheduler_start():
     await asyncio.sleep(10)
     
     logger.info("🔄 Starting background scheduler...")
-    from app.scheduler import scheduler
-    from app.tasks import run_job_fetcher, run_course_fetcher, run_cleanup
     
     # Schedule tasks
     scheduler.add_task(run_job_fetcher, interval_hours=6, name="Job Fetcher")
@@ -119,6 +185,7 @@ app = FastAPI(
     title="EverythingInBot API",
     description="Telegram Super-App with 10 Feature Modules",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -137,6 +204,11 @@ app.add_middleware(
 # UPTIMEROBOT HEARTBEAT ENDPOINT
 # ============================================
 
+# Serialized heartbeat body, rebuilt at most once per UPTIME_REFRESH_SECONDS
+UPTIME_REFRESH_SECONDS = 1.0
+_UPTIME_CACHE = {"ts": float("-inf"), "body": b""}
+
+
 @app.get("/uptime")
 @app.head("/uptime")
 async def uptime_check():
@@ -147,56 +219,106 @@ async def uptime_check():
     Supports both GET and HEAD methods (UptimeRobot uses HEAD)
     
     Returns:
-        Status and timestamp
+        Status and timestamp (pre-serialized, refreshed once per second)
     """
-    from datetime import datetime
-    return {
-        "status": "alive",
-        "service": "EverythingInBot",
-        "timestamp": datetime.utcnow().isoformat(),
-        "version": "1.0.0"
-    }
+    now = time.monotonic()
+    if now - _UPTIME_CACHE["ts"] >= UPTIME_REFRESH_SECONDS:
+        _UPTIME_CACHE["body"] = orjson.dumps({
+            "status": "alive",
+            "service": "EverythingInBot",
+            "timestamp": datetime.utcnow().isoformat(),
+            "version": "1.0.0"
+        })
+        _UPTIME_CACHE["ts"] = now
+    return Response(content=_UPTIME_CACHE["body"], media_type="application/json")
 
 
 # ============================================
 # WEBHOOK ENDPOINT
 # ============================================
 
-@app.post(f"{settings.TELEGRAM_WEBHOOK_PATH}/{{token}}")
-async def webhook_handler(request: Request, token: str) -> Response:
+# Header name as it appears in the ASGI scope (lower-case bytes)
+_SECRET_HEADER = b"x-telegram-bot-api-secret-token"
+
+
+async def _send_status(send, status_code: int):
+    """Send an empty-body response on a raw ASGI channel"""
+    await send({"type": "http.response.start", "status": status_code, "headers": []})
+    await send({"type": "http.response.body", "body": b""})
+
+
+class WebhookEndpoint:
     """
-    Telegram Webhook Handler
+    Telegram Webhook Handler (raw ASGI)
     CRITICAL: Returns instantly (<1ms) to prevent Render timeout/restart
     Update processing happens in background task
-    """
-    # Verify token (fast check)
-    if token != settings.TELEGRAM_BOT_TOKEN:
-        logger.warning("❌ Invalid webhook token")
-        return Response(status_code=403)
-    
-    # Verify secret token (fast check)
-    secret_token = request.headers.get("X-Telegram-Bot-Api-Secret-Token")
-    if secret_token != settings.TELEGRAM_WEBHOOK_SECRET:
-        logger.warning("❌ Invalid secret token")
-        return Response(status_code=403)
     
-    # Get update data
-    try:
-        update_data = await request.json()
-    except Exception as e:
-        logger.warning(f"⚠️ Malformed update: {e}")
-        return Response(status_code=200)  # Return 200 to prevent retries
-    
-    # Log incoming update (minimal logging)
-    update_id = update_data.get('update_id', 'unknown')
-    logger.info(f"📨 Update {update_id} received")
-    
-    # Process update in background (NON-BLOCKING)
-    # This is CRITICAL - webhook returns instantly
-    asyncio.create_task(process_update(update_data))
+    Mounted as a plain Starlette route, so FastAPI's dependency solving and
+    response handling are skipped on the hottest path of the app.
+    """
     
-    # Return 200 immediately (<1ms)
-    return Response(status_code=200)
+    async def __call__(self, scope, receive, send):
+        # Verify token (constant-time check)
+        token = scope["path_params"]["token"]
+        if not hmac.compare_digest(token.encode(), _EXPECTED_TOKEN):
+            logger.warning("❌ Invalid webhook token")
+            await _send_status(send, 403)
+            return
+        
+        # Verify secret token (constant-time check)
+        secret_token = None
+        for name, value in scope["headers"]:
+            if name == _SECRET_HEADER:
+                secret_token = value
+                break
+        if secret_token is None or not hmac.compare_digest(secret_token, _EXPECTED_SECRET):
+            logger.warning("❌ Invalid secret token")
+            await _send_status(send, 403)
+            return
+        
+        # Read the request body
+        chunks = []
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                break
+        
+        # Get update data
+        try:
+            update_data = orjson.loads(b"".join(chunks))
+        except Exception as e:
+            logger.warning(f"⚠️ Malformed update: {e}")
+            await _send_status(send, 200)  # Return 200 to prevent retries
+            return
+        
+        # Log incoming update (sampled - per-update INFO logs cost real throughput)
+        if next(_update_counter) % LOG_SAMPLE_EVERY == 0:
+            logger.info("📨 Update %s received (1 in %s logged)", update_data.get('update_id'), LOG_SAMPLE_EVERY)
+        elif logger.isEnabledFor(logging.DEBUG):
+            logger.debug("📨 Update %s received", update_data.get('update_id'))
+        
+        # Process update in background (NON-BLOCKING)
+        # This is CRITICAL - webhook returns instantly
+        task = asyncio.create_task(_run_update(update_data))
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+        
+        # Return 200 immediately (<1ms)
+        await _send_status(send, 200)
+
+
+app.router.routes.append(
+    Route(f"{settings.TELEGRAM_WEBHOOK_PATH}/{{token}}", endpoint=WebhookEndpoint(), methods=["POST"])
+)
+
+
+async def _run_update(update_data: dict):
+    """Process an update once a concurrency slot is free"""
+    async with _update_semaphore:
+        await process_update(update_data)
 
 
 async def process_update(update_data: dict):
@@ -205,21 +327,24 @@ async def process_update(update_data: dict):
     This runs asynchronously and never blocks the webhook
     """
     try:
-        # Log update type
-        if 'message' in update_data:
-            msg = update_data['message']
-            user_id = msg.get('from', {}).get('id', 'unknown')
-            text = msg.get('text', 'no text')
-            logger.info(f"💬 Message from {user_id}: {text[:50]}")
-        elif 'callback_query' in update_data:
-            cb = update_data['callback_query']
-            user_id = cb.get('from', {}).get('id', 'unknown')
-            data = cb.get('data', 'no data')
-            logger.info(f"🔘 Callback from {user_id}: {data}")
+        # Log update type (debug only)
+        if logger.isEnabledFor(logging.DEBUG):
+            if 'message' in update_data:
+                msg = update_data['message']
+                user_id = msg.get('from', {}).get('id', 'unknown')
+                text = msg.get('text', 'no text')
+                logger.debug("💬 Message from %s: %s", user_id, text[:50])
+            elif 'callback_query' in update_data:
+                cb = update_data['callback_query']
+                user_id = cb.get('from', {}).get('id', 'unknown')
+                data = cb.get('data', 'no data')
+                logger.debug("🔘 Callback from %s: %s", user_id, data)
         
-        # Feed to dispatcher
-        await dp.feed_webhook_update(bot, update_data)
-        logger.info("✅ Update processed")
+        # Validate once and feed the typed update straight to the dispatcher
+        # (the webhook already answered, no webhook-response handling needed)
+        update = Update.model_validate(update_data, context={"bot": bot})
+        await dp.feed_update(bot, update)
+        logger.debug("✅ Update processed")
         
     except Exception as e:
         logger.error(f"❌ Update processing error: {e}", exc_info=False)  # No stack trace spam
@@ -229,24 +354,29 @@ async def process_update(update_data: dict):
 # HEALTH CHECK
 # ============================================
 
+# Static bodies, serialized once at import
+_HEALTH_BODY = orjson.dumps({
+    "status": "healthy",
+    "service": "EverythingInBot",
+    "version": "1.0.0"
+})
+_ROOT_BODY = orjson.dumps({
+    "message": "EverythingInBot API is running",
+    "docs": "/docs",
+    "health": "/health"
+})
+
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint for Render"""
-    return {
-        "status": "healthy",
-        "service": "EverythingInBot",
-        "version": "1.0.0"
-    }
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
 @app.get("/")
 async def root():
     """Root endpoint"""
-    return {
-        "message": "EverythingInBot API is running",
-        "docs": "/docs",
-        "health": "/health"
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 
 # ============================================
@@ -270,10 +400,13 @@ if __name__ == "__main__":
     import uvicorn
     
     # For local development only
-    # In production, use: uvicorn app.main:app
+    # In production, use: uvicorn app.main:app --workers $WEB_CONCURRENCY --loop uvloop --http httptools --no-access-log
     uvicorn.run(
         "app.main:app",
         host="0.0.0.0",
         port=8000,
+        loop="uvloop",
+        http="httptools",
+        access_log=False,  # Webhook hits would log twice per update
         reload=True
     )
@@ -0,0 +1,73 @@
+"""
+Guard Middleware
+Single-pass user tracking, spam protection and rate limiting
+"""
+
+from aiogram import BaseMiddleware
+from aiogram.types import Message, CallbackQuery, TelegramObject
+from typing import Callable, Dict, Any, Awaitable
+
+from app.middlewares.ip_tracking import track_user
+from app.middlewares.rate_limit import RateLimitMiddleware
+from app.middlewares.spam_protection import SpamProtectionMiddleware
+
+
+class CompositeGuardMiddleware(BaseMiddleware):
+    """
+    Runs the per-user guards in one middleware frame
+    
+    Same checks and order as registering IPTrackingMiddleware,
+    SpamProtectionMiddleware and RateLimitMiddleware separately:
+    1. Tracking data injection
+    2. Spam protection (messages only, silent drop)
+    3. Rate limiting (replies with a cooldown notice)
+    """
+    
+    def __init__(
+        self,
+        spam_protection: SpamProtectionMiddleware,
+        rate_limiter: RateLimitMiddleware
+    ):
+        """
+        Initialize guard middleware
+        
+        Args:
+            spam_protection: Spam tracker (its state is used, not its __call__)
+            rate_limiter: Rate limiter (its state is used, not its __call__)
+        """
+        super().__init__()
+        self.spam_protection = spam_protection
+        self.rate_limiter = rate_limiter
+    
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: Dict[str, Any]
+    ) -> Any:
+        """Track, then drop spam, then enforce rate limits"""
+        # One type dispatch for all guards
+        if isinstance(event, Message):
+            user = event.from_user
+            chat = event.chat
+            action_type = 'command' if event.text and event.text.startswith('/') else 'message'
+        elif isinstance(event, CallbackQuery):
+            user = event.from_user
+            chat = event.message.chat if event.message else None
+            action_type = 'callback'
+        else:
+            return await handler(event, data)
+        
+        track_user(user, chat, data)
+        
+        # Anonymous events (e.g. channel posts) have nobody to limit
+        if not user:
+            return await handler(event, data)
+        
+        if action_type != 'callback' and await self.spam_protection.is_spam(user.id):
+            return  # Silently drop
+        
+        if not await self.rate_limiter.allow(event, user.id, action_type):
+            return
+        
+        return await handler(event, data)
@@ -4,13 +4,37 @@ Tracks user interactions for logging purposes
 """
 
 from aiogram import BaseMiddleware
-from aiogram.types import Message, CallbackQuery, TelegramObject
-from typing import Callable, Dict, Any, Awaitable
+from aiogram.types import Message, CallbackQuery, TelegramObject, User, Chat
+from typing import Callable, Dict, Any, Awaitable, Optional
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+def track_user(user: Optional[User], chat: Optional[Chat], data: Dict[str, Any]):
+    """
+    Store user and chat information in handler data
+    
+    Args:
+        user: Sender of the event (if any)
+        chat: Chat of the event (if any)
+        data: Handler data dict to fill
+    """
+    if user:
+        data["user_id"] = user.id
+        data["username"] = user.username or "unknown"
+        data["first_name"] = user.first_name or "unknown"
+        data["language_code"] = user.language_code or "unknown"
+    
+    if chat:
+        data["chat_id"] = chat.id
+        data["chat_type"] = chat.type
+    
+    # Note: IP address is not available from Telegram API
+    # Telegram servers act as proxy, so we can't get real user IP
+    data["ip_address"] = None
+
+
 class IPTrackingMiddleware(BaseMiddleware):
     """
     Aiogram middleware to track user information
@@ -39,19 +63,7 @@ class IPTrackingMiddleware(BaseMiddleware):
                 chat = event.message.chat if event.message else None
             
             # Store user information in data for handlers to access
-            if user:
-                data["user_id"] = user.id
-                data["username"] = user.username or "unknown"
-                data["first_name"] = user.first_name or "unknown"
-                data["language_code"] = user.language_code or "unknown"
-            
-            if chat:
-                data["chat_id"] = chat.id
-                data["chat_type"] = chat.type
-            
-            # Note: IP address is not available from Telegram API
-            # Telegram servers act as proxy, so we can't get real user IP
-            data["ip_address"] = None
+            track_user(user, chat, data)
             
         except Exception as e:
             logger.error(f"Error in IP tracking middleware: {str(e)}")
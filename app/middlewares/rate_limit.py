@@ -5,13 +5,21 @@ Prevent abuse by limiting user actions per time window
 
 from aiogram import BaseMiddleware
 from aiogram.types import Message, CallbackQuery
-from typing import Callable, Dict, Any, Awaitable
-from datetime import datetime, timedelta
-from collections import defaultdict
+from typing import Callable, Dict, Any, Awaitable, Tuple
+from collections import deque
 import logging
+import time
+
+from redis.exceptions import RedisError
+
+from app.redis_client import RedisClient, GUARD_BLOCKED, GUARD_EXCEEDED
+from app.utils.lru import LRUDict
 
 logger = logging.getLogger(__name__)
 
+# Cooldown applied when a limit is exceeded (seconds)
+COOLDOWN_SECONDS = 30
+
 
 class RateLimitMiddleware(BaseMiddleware):
     """
@@ -48,11 +56,32 @@ class RateLimitMiddleware(BaseMiddleware):
             'callback': (callback_limit, callback_window)
         }
         
-        # Track user actions
-        self.user_actions: Dict[int, Dict[str, list]] = defaultdict(lambda: defaultdict(list))
+        # Reply texts, built once (sent on the rejection path, i.e. during floods)
+        self._msg_wait = (
+            "⏳ <b>Rate Limit</b>\n\n"
+            "You're sending too many requests.\n"
+            "Please wait <b>%d seconds</b> before trying again."
+        )
+        self._alert_wait = "⏳ Please wait %ds"
+        self._msg_exceeded = {
+            action_type: (
+                f"⚠️ <b>Rate Limit Exceeded</b>\n\n"
+                f"You've sent too many {action_type}s.\n"
+                f"Cooldown: <b>{COOLDOWN_SECONDS} seconds</b>\n\n"
+                f"<i>Limit: {limit} {action_type}s per {window} seconds</i>"
+            )
+            for action_type, (limit, window) in self.limits.items()
+        }
+        self._alert_exceeded = f"⚠️ Too many requests! Wait {COOLDOWN_SECONDS}s"
         
-        # Cooldown tracking
-        self.user_cooldowns: Dict[int, datetime] = {}
+        # Local fallback state (used when Redis is unavailable)
+        # Track user actions (monotonic timestamps, one ring buffer per action
+        # type sized to its limit - older entries can never matter)
+        # Both maps are LRU-bounded so floods of new user IDs can't grow them
+        self.user_actions: Dict[int, Dict[str, deque]] = LRUDict()
+        
+        # Cooldown tracking (monotonic deadline)
+        self.user_cooldowns: Dict[int, float] = LRUDict()
     
     async def __call__(
         self,
@@ -62,31 +91,6 @@ class RateLimitMiddleware(BaseMiddleware):
     ) -> Any:
         """Check rate limit before processing"""
         
-        user_id = event.from_user.id
-        now = datetime.utcnow()
-        
-        # Check if user is in cooldown
-        if user_id in self.user_cooldowns:
-            cooldown_until = self.user_cooldowns[user_id]
-            if now < cooldown_until:
-                remaining = int((cooldown_until - now).total_seconds())
-                
-                if isinstance(event, Message):
-                    await event.answer(
-                        f"⏳ <b>Rate Limit</b>\n\n"
-                        f"You're sending too many requests.\n"
-                        f"Please wait <b>{remaining} seconds</b> before trying again."
-                    )
-                elif isinstance(event, CallbackQuery):
-                    await event.answer(
-                        f"⏳ Please wait {remaining}s",
-                        show_alert=True
-                    )
-                return
-            else:
-                # Cooldown expired
-                del self.user_cooldowns[user_id]
-        
         # Determine action type
         if isinstance(event, Message):
             action_type = 'command' if event.text and event.text.startswith('/') else 'message'
@@ -95,49 +99,126 @@ class RateLimitMiddleware(BaseMiddleware):
         else:
             action_type = 'message'
         
-        # Get limits for this action type
-        limit, window = self.limits[action_type]
+        if not await self.allow(event, event.from_user.id, action_type):
+            return
         
-        # Clean old actions outside the time window
-        cutoff_time = now - timedelta(seconds=window)
-        self.user_actions[user_id][action_type] = [
-            timestamp for timestamp in self.user_actions[user_id][action_type]
-            if timestamp > cutoff_time
-        ]
+        # Continue processing
+        return await handler(event, data)
+    
+    async def allow(self, event: Message | CallbackQuery, user_id: int, action_type: str) -> bool:
+        """
+        Record an action and check it against the user's limits
         
-        # Check if limit exceeded
-        action_count = len(self.user_actions[user_id][action_type])
+        Users over the limit (or in cooldown) are told to wait.
         
-        if action_count >= limit:
-            # Apply cooldown (30 seconds)
-            cooldown_duration = 30
-            self.user_cooldowns[user_id] = now + timedelta(seconds=cooldown_duration)
+        Args:
+            event: Incoming message or callback (used to reply)
+            user_id: Telegram user ID
+            action_type: 'message', 'command' or 'callback'
             
+        Returns:
+            True if the event may be processed
+        """
+        # Get limits for this action type
+        limit, window = self.limits[action_type]
+        
+        # Shared Redis state enforces limits across workers; local state is
+        # the fallback when Redis is not connected or fails
+        if RedisClient.client is None:
+            status, value = self._check_local(user_id, action_type, limit, window)
+        else:
+            try:
+                status, value = await self._check_redis(user_id, action_type, limit, window)
+            # socket_timeout surfaces as redis TimeoutError (a RedisError); the
+            # builtin TimeoutError covers asyncio timeouts raised around the socket
+            except (RedisError, TimeoutError) as e:
+                logger.warning(f"Rate limit store unavailable, using local state: {e}")
+                status, value = self._check_local(user_id, action_type, limit, window)
+        
+        if status == 'cooldown':
+            if isinstance(event, Message):
+                await event.answer(self._msg_wait % value)
+            elif isinstance(event, CallbackQuery):
+                await event.answer(self._alert_wait % value, show_alert=True)
+            return False
+        
+        if status == 'exceeded':
             logger.warning(
                 f"Rate limit exceeded for user {user_id}: "
-                f"{action_count} {action_type}s in {window}s"
+                f"{value} {action_type}s in {window}s"
             )
             
             if isinstance(event, Message):
-                await event.answer(
-                    f"⚠️ <b>Rate Limit Exceeded</b>\n\n"
-                    f"You've sent too many {action_type}s.\n"
-                    f"Cooldown: <b>{cooldown_duration} seconds</b>\n\n"
-                    f"<i>Limit: {limit} {action_type}s per {window} seconds</i>"
-                )
+                await event.answer(self._msg_exceeded[action_type])
             elif isinstance(event, CallbackQuery):
-                await event.answer(
-                    f"⚠️ Too many requests! Wait {cooldown_duration}s",
-                    show_alert=True
-                )
-            
-            return
+                await event.answer(self._alert_exceeded, show_alert=True)
+            return False
         
-        # Record this action
-        self.user_actions[user_id][action_type].append(now)
+        return True
+    
+    async def _check_redis(self, user_id: int, action_type: str, limit: int, window: int) -> Tuple[str, int]:
+        """
+        Check and record an action in Redis (one round trip)
         
-        # Continue processing
-        return await handler(event, data)
+        Returns:
+            ('cooldown', seconds left), ('exceeded', action count) or ('ok', action count)
+        """
+        outcome, value = await RedisClient.guard_hit(
+            f"rl:cd:{user_id}",
+            f"rl:{user_id}:{action_type}",
+            window,
+            limit,
+            COOLDOWN_SECONDS
+        )
+        if outcome == GUARD_BLOCKED:
+            return 'cooldown', value
+        if outcome == GUARD_EXCEEDED:
+            return 'exceeded', value
+        
+        return 'ok', value
+    
+    def _check_local(self, user_id: int, action_type: str, limit: int, window: int) -> Tuple[str, int]:
+        """
+        Check and record an action in this process's state
+        
+        Returns:
+            ('cooldown', seconds left), ('exceeded', action count) or ('ok', action count)
+        """
+        now = time.monotonic()
+        
+        # Check if user is in cooldown
+        if user_id in self.user_cooldowns:
+            cooldown_until = self.user_cooldowns[user_id]
+            if now < cooldown_until:
+                return 'cooldown', int(cooldown_until - now)
+            else:
+                # Cooldown expired
+                del self.user_cooldowns[user_id]
+        
+        actions = self.user_actions.get(user_id)
+        if actions is None:
+            actions = self.user_actions[user_id] = {}
+        else:
+            self.user_actions.touch(user_id)
+        timestamps = actions.get(action_type)
+        if timestamps is None:
+            timestamps = actions[action_type] = deque(maxlen=limit)
+        
+        # Drop old actions outside the time window (oldest first)
+        cutoff_time = now - window
+        while timestamps and timestamps[0] <= cutoff_time:
+            timestamps.popleft()
+        
+        # Check if limit exceeded
+        action_count = len(timestamps)
+        
+        if action_count >= limit:
+            self.user_cooldowns[user_id] = now + COOLDOWN_SECONDS
+            return 'exceeded', action_count
+        
+        # Record this action
+        timestamps.append(now)
+        return 'ok', action_count
     
     def reset_user(self, user_id: int):
         """
@@ -165,5 +246,5 @@ class RateLimitMiddleware(BaseMiddleware):
         """
         return {
             action_type: len(timestamps)
-            for action_type, timestamps in self.user_actions[user_id].items()
+            for action_type, timestamps in self.user_actions.get(user_id, {}).items()
         }
@@ -5,12 +5,25 @@ Silently blocks users who send >5 messages in 5 seconds for 5 minutes
 
 import time
 import logging
+from collections import deque
 from typing import Callable, Dict, Any, Awaitable
 from aiogram import BaseMiddleware
 from aiogram.types import TelegramObject
+from redis.exceptions import RedisError
+
+from app.redis_client import RedisClient, GUARD_BLOCKED, GUARD_EXCEEDED
+from app.utils.lru import LRUDict
 
 logger = logging.getLogger(__name__)
 
+# Flood rule: more than FLOOD_LIMIT messages within FLOOD_WINDOW seconds
+FLOOD_LIMIT = 5
+FLOOD_WINDOW = 5
+BLOCK_SECONDS = 300
+
+# Idle users are swept from the tracker after this many new users
+SWEEP_EVERY = 64
+
 
 class SpamProtectionMiddleware(BaseMiddleware):
     """
@@ -22,8 +35,12 @@ class SpamProtectionMiddleware(BaseMiddleware):
     
     def __init__(self):
         super().__init__()
-        self.user_messages: Dict[int, list] = {}
-        self.blocked: Dict[int, float] = {}
+        # Local fallback state (used when Redis is unavailable)
+        # Per-user ring buffer of recent message times (monotonic)
+        # Both maps are LRU-bounded so floods of new user IDs can't grow them
+        self.user_messages: Dict[int, deque] = LRUDict()
+        self.blocked: Dict[int, float] = LRUDict()
+        self._new_users = 0
     
     async def __call__(
         self,
@@ -44,32 +61,106 @@ class SpamProtectionMiddleware(BaseMiddleware):
         if not user:
             return await handler(event, data)
         
-        user_id = user.id
-        now = time.time()
+        if await self.is_spam(user.id):
+            return  # Silently drop
+        
+        # Not spam - process normally
+        return await handler(event, data)
+    
+    async def is_spam(self, user_id: int) -> bool:
+        """
+        Record a message from a user and check whether it must be dropped
+        
+        Shared Redis state enforces the block across workers; local state is
+        the fallback when Redis is not connected or fails.
+        
+        Args:
+            user_id: Telegram user ID
+            
+        Returns:
+            True if the user is (or just became) blocked
+        """
+        if RedisClient.client is None:
+            return self._is_spam_local(user_id)
+        
+        try:
+            return await self._is_spam_redis(user_id)
+        # socket_timeout surfaces as redis TimeoutError (a RedisError); the
+        # builtin TimeoutError covers asyncio timeouts raised around the socket
+        except (RedisError, TimeoutError) as e:
+            logger.warning(f"Spam store unavailable, using local state: {e}")
+            return self._is_spam_local(user_id)
+    
+    async def _is_spam_redis(self, user_id: int) -> bool:
+        """Redis version of the flood check (block and window shared by workers, one round trip)"""
+        # Every message is recorded; blocked once FLOOD_LIMIT were already in
+        # the window (>5 messages in 5 seconds), for BLOCK_SECONDS
+        outcome, _ = await RedisClient.guard_hit(
+            f"spam:ban:{user_id}",
+            f"spam:flood:{user_id}",
+            FLOOD_WINDOW,
+            FLOOD_LIMIT,
+            BLOCK_SECONDS,
+            record_all=True
+        )
+        
+        if outcome == GUARD_BLOCKED:
+            logger.warning(f"🚫 Spam blocked: user {user_id}")
+            return True
+        
+        if outcome == GUARD_EXCEEDED:
+            logger.warning(f"⚠️ Spam detected: user {user_id} blocked for 5 minutes")
+            return True
+        
+        return False
+    
+    def _is_spam_local(self, user_id: int) -> bool:
+        """In-process version of the flood check"""
+        now = time.monotonic()
         
         # Check if user is blocked
         if user_id in self.blocked:
             if self.blocked[user_id] > now:
                 # Still blocked - silently drop
                 logger.warning(f"🚫 Spam blocked: user {user_id}")
-                return  # No response
+                return True
             else:
                 # Block expired - remove
                 del self.blocked[user_id]
                 logger.info(f"✅ Unblocked: user {user_id}")
         
-        # Count messages in last 5 seconds
-        timestamps = self.user_messages.get(user_id, [])
-        timestamps = [t for t in timestamps if now - t < 5]
+        # Count messages in last 5 seconds (oldest drop off the left)
+        timestamps = self.user_messages.get(user_id)
+        if timestamps is None:
+            self._new_users += 1
+            if self._new_users >= SWEEP_EVERY:
+                self._sweep(now)
+            timestamps = self.user_messages[user_id] = deque(maxlen=FLOOD_LIMIT + 1)
+        else:
+            self.user_messages.touch(user_id)
+        
+        cutoff = now - FLOOD_WINDOW
+        while timestamps and timestamps[0] <= cutoff:
+            timestamps.popleft()
         timestamps.append(now)
-        self.user_messages[user_id] = timestamps
         
         # Check for spam (>5 messages in 5 seconds)
-        if len(timestamps) > 5:
+        if len(timestamps) > FLOOD_LIMIT:
             # Block user for 5 minutes
-            self.blocked[user_id] = now + 300
+            self.blocked[user_id] = now + BLOCK_SECONDS
             logger.warning(f"⚠️ Spam detected: user {user_id} blocked for 5 minutes")
-            return  # Silently drop
+            return True
         
-        # Not spam - process normally
-        return await handler(event, data)
+        return False
+    
+    def _sweep(self, now: float):
+        """Forget users with no message inside the flood window"""
+        cutoff = now - FLOOD_WINDOW
+        idle = [
+            user_id
+            for user_id, timestamps in self.user_messages.items()
+            if not timestamps or timestamps[-1] <= cutoff
+        ]
+        for user_id in idle:
+            del self.user_messages[user_id]
+        self._new_users = 0
@@ -3,18 +3,63 @@ Redis Client for FSM State Management and Caching
 Using Render Key-Value Store (Redis)
 """
 
+import asyncio
 import os
+import time
 import redis.asyncio as redis
-from typing import Optional
+from redis.commands.core import AsyncScript
+from typing import Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Guard outcomes returned by RedisClient.guard_hit
+GUARD_OK = 0        # value = hits already in the window
+GUARD_BLOCKED = 1   # value = seconds left on the block
+GUARD_EXCEEDED = 2  # value = hits already in the window (block just set)
+
+# Block check + sliding-window counter + block on overflow, shared by all
+# workers in a single round trip
+# KEYS[1] = block key, KEYS[2] = window key
+# ARGV = now (seconds), window (seconds), limit, member, block seconds, record_all
+# Returns {outcome, value}. The hit is recorded only while under the limit,
+# unless record_all is 1 (then every hit is recorded).
+_GUARD_LUA = """
+local block_ms = redis.call('PTTL', KEYS[1])
+if block_ms > 0 then
+    return {1, math.floor(block_ms / 1000)}
+end
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local limit = tonumber(ARGV[3])
+redis.call('ZREMRANGEBYSCORE', KEYS[2], '-inf', now - window)
+local count = redis.call('ZCARD', KEYS[2])
+if ARGV[6] == '1' or count < limit then
+    redis.call('ZADD', KEYS[2], now, ARGV[4])
+    redis.call('EXPIRE', KEYS[2], math.ceil(window))
+end
+if count >= limit then
+    redis.call('SET', KEYS[1], 1, 'EX', ARGV[5])
+    return {2, count}
+end
+return {0, count}
+"""
+
+# Connection pool size per worker process; all of it is opened at startup
+REDIS_MAX_CONNECTIONS = 16
+
+# Socket timeouts (seconds). Redis sits on every update's path through the
+# guard middleware, so a hung server must fail fast (RedisError) and let the
+# middlewares fall back to their local state instead of blocking updates
+REDIS_SOCKET_TIMEOUT = 0.5
+REDIS_CONNECT_TIMEOUT = 2
+
 
 class RedisClient:
     """Redis Client Manager"""
     
     client: Optional[redis.Redis] = None
+    _guard: Optional[AsyncScript] = None
     
     @classmethod
     async def connect_redis(cls):
@@ -29,12 +74,21 @@ class RedisClient:
                 redis_url,
                 encoding="utf-8",
                 decode_responses=True,
-                max_connections=10
+                max_connections=REDIS_MAX_CONNECTIONS,
+                socket_timeout=REDIS_SOCKET_TIMEOUT,
+                socket_connect_timeout=REDIS_CONNECT_TIMEOUT,
+                health_check_interval=30,
+                socket_keepalive=True
             )
             
-            # Test connection
-            await cls.client.ping()
-            logger.info("✅ Connected to Redis successfully")
+            # Test connection and warm the pool: concurrent PINGs each check
+            # out their own connection, so the first webhooks find open sockets
+            await asyncio.gather(*(cls.client.ping() for _ in range(REDIS_MAX_CONNECTIONS)))
+            
+            # Preload the guard script so the first call is a plain EVALSHA
+            cls._guard = cls.client.register_script(_GUARD_LUA)
+            await cls.client.script_load(_GUARD_LUA)
+            logger.info(f"✅ Connected to Redis successfully ({REDIS_MAX_CONNECTIONS} connections warm)")
             
         except Exception as e:
             logger.error(f"❌ Failed to connect to Redis: {e}")
@@ -47,6 +101,44 @@ class RedisClient:
             await cls.client.close()
             logger.info("Redis connection closed")
     
+    @classmethod
+    async def guard_hit(
+        cls,
+        block_key: str,
+        window_key: str,
+        window: float,
+        limit: int,
+        block_seconds: int,
+        record_all: bool = False
+    ) -> Tuple[int, int]:
+        """
+        Check a block, record a hit in a sliding window and block on overflow
+        
+        All of it runs in one EVALSHA (the script is loaded once).
+        
+        Args:
+            block_key: Redis key whose TTL is the block/cooldown
+            window_key: Redis key of the sliding window
+            window: Window length in seconds
+            limit: Hits already in the window that trigger the block
+            block_seconds: Block length set when the limit is reached
+            record_all: Record the hit even when over the limit
+            
+        Returns:
+            (GUARD_OK, hits), (GUARD_BLOCKED, seconds left) or (GUARD_EXCEEDED, hits)
+        """
+        client = cls.get_redis()
+        if cls._guard is None:
+            cls._guard = client.register_script(_GUARD_LUA)
+        
+        now = time.time()
+        member = f"{time.time_ns()}:{os.getpid()}"
+        outcome, value = await cls._guard(
+            keys=[block_key, window_key],
+            args=[now, window, limit, member, block_seconds, 1 if record_all else 0]
+        )
+        return int(outcome), int(value)
+    
     @classmethod
     def get_redis(cls) -> redis.Redis:
         """Get Redis client instance"""
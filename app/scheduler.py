@@ -55,9 +55,12 @@ class BackgroundScheduler:
                             logger.info(f"✅ Task completed: {task['name']}")
                         except Exception as e:
                             logger.error(f"❌ Task failed: {task['name']} - {e}")
-                
-                # Sleep for 1 minute before checking again
-                await asyncio.sleep(60)
+            
+            except Exception as e:
+                logger.error(f"❌ Scheduler loop error: {e}")
+            
+            # Sleep for 1 minute before checking again
+            await asyncio.sleep(60)
     
     def stop(self):
         """Stop the scheduler"""
@@ -1,12 +1,12 @@
 """
 Course Fetching Task Runner
-Fetches courses from all 6 platforms
+Fetches courses from all 5 platforms
 """
 
 import logging
 from app.database import Database
 from app.fetchers.course_fetcher import fetch_all_courses
-from app.utils.deduplication import deduplicate_list
+from app.utils.deduplication import deduplicate_list, legacy_course_hash, upsert_by_hash
 
 logger = logging.getLogger(__name__)
 
@@ -36,10 +36,10 @@ async def run_course_fetcher():
         updated_count = 0
         
         for course in unique_courses:
-            result = await db.courses.update_one(
-                {"hash": course['hash']},
-                {"$set": course},
-                upsert=True
+            result = await upsert_by_hash(
+                db.courses,
+                course,
+                legacy_course_hash(course['title'], course['platform'])
             )
             
             if result.upserted_id:
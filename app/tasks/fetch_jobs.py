@@ -4,50 +4,82 @@ Fetches jobs from all 12 sources
 """
 
 import logging
+from typing import Any, Dict, List, Tuple
+
 from app.database import Database
-from app.fetchers.job_fetcher import fetch_all_jobs
-from app.utils.deduplication import deduplicate_list
+from app.fetchers.job_fetcher import fetch_all_jobs, mark_jobs_seen
+from app.utils.deduplication import deduplicate_list, legacy_job_hash, upsert_by_hash
 
 logger = logging.getLogger(__name__)
 
 
+async def _store_jobs(db, jobs: List[Dict[str, Any]]) -> Tuple[int, int]:
+    """
+    Upsert jobs and mark the stored ones as seen
+    
+    Args:
+        db: Database instance
+        jobs: Deduplicated jobs
+        
+    Returns:
+        (inserted, updated) counts
+    """
+    inserted_count = 0
+    updated_count = 0
+    stored = []
+    
+    try:
+        for job in jobs:
+            result = await upsert_by_hash(
+                db.jobs,
+                job,
+                legacy_job_hash(job['title'], job['company'], job['url'])
+            )
+            stored.append(job)
+            
+            if result.upserted_id:
+                inserted_count += 1
+            elif result.modified_count > 0:
+                updated_count += 1
+    finally:
+        # Only listings that reached the database are skipped next time
+        mark_jobs_seen(stored)
+    
+    return inserted_count, updated_count
+
+
 async def run_job_fetcher():
     """
     Fetch jobs from all sources and store in database
     Runs every 6 hours via background scheduler
+    
+    Each source's batch is stored as soon as that source finishes, so a
+    slow feed doesn't hold back the others.
     """
     try:
         logger.info("🔄 Starting job fetch task...")
         
-        # Fetch from all sources
-        jobs = await fetch_all_jobs()
+        db = Database.get_db()
+        stored_hashes = set()
+        totals = {'inserted': 0, 'updated': 0}
+        
+        async def store_batch(batch: List[Dict[str, Any]]):
+            # Deduplicate within the batch and against earlier batches
+            unique_jobs = [job for job in deduplicate_list(batch, hash_key='hash') if job['hash'] not in stored_hashes]
+            inserted, updated = await _store_jobs(db, unique_jobs)
+            stored_hashes.update(job['hash'] for job in unique_jobs)
+            totals['inserted'] += inserted
+            totals['updated'] += updated
+        
+        # Fetch from all sources, storing each batch as it arrives
+        jobs = await fetch_all_jobs(on_batch=store_batch)
         
         if not jobs:
             logger.warning("⚠️  No jobs fetched")
             return
         
-        # Deduplicate
-        unique_jobs = deduplicate_list(jobs, hash_key='hash')
-        logger.info(f"📊 Deduplicated: {len(jobs)} → {len(unique_jobs)} jobs")
-        
-        # Store in database
-        db = Database.get_db()
-        inserted_count = 0
-        updated_count = 0
-        
-        for job in unique_jobs:
-            result = await db.jobs.update_one(
-                {"hash": job['hash']},
-                {"$set": job},
-                upsert=True
-            )
-            
-            if result.upserted_id:
-                inserted_count += 1
-            elif result.modified_count > 0:
-                updated_count += 1
-        
-        logger.info(f"✅ Job fetch complete: {inserted_count} inserted, {updated_count} updated")
+        logger.info(f"📊 Deduplicated: {len(jobs)} → {len(stored_hashes)} jobs")
+        logger.info(f"✅ Job fetch complete: {totals['inserted']} inserted, {totals['updated']} updated")
         
     except Exception as e:
         logger.error(f"❌ Job fetch error: {e}")
@@ -4,9 +4,15 @@ Hash-based duplicate detection for jobs and courses
 """
 
 import hashlib
+import xxhash
+from functools import lru_cache
 from typing import Dict, Any
 
+# Scheduler runs see mostly the same listings - memoize their hashes
+HASH_CACHE_SIZE = 8192
 
+
+@lru_cache(maxsize=HASH_CACHE_SIZE)
 def generate_job_hash(title: str, company: str, url: str) -> str:
     """
     Generate unique hash for job listing
@@ -17,13 +23,14 @@ def generate_job_hash(title: str, company: str, url: str) -> str:
         url: Job URL
         
     Returns:
-        MD5 hash string
+        128-bit XXH3 hex digest (same length as the former MD5 hashes)
     """
     # Normalize and combine fields
     data = f"{title.lower().strip()}|{company.lower().strip()}|{url.strip()}"
-    return hashlib.md5(data.encode('utf-8')).hexdigest()
+    return xxhash.xxh3_128_hexdigest(data.encode('utf-8'))
 
 
+@lru_cache(maxsize=HASH_CACHE_SIZE)
 def generate_course_hash(title: str, platform: str) -> str:
     """
     Generate unique hash for course
@@ -33,13 +40,58 @@ def generate_course_hash(title: str, platform: str) -> str:
         platform: Platform name
         
     Returns:
-        MD5 hash string
+        128-bit XXH3 hex digest (same length as the former MD5 hashes)
     """
     # Normalize and combine fields
     data = f"{title.lower().strip()}|{platform.lower().strip()}"
+    return xxhash.xxh3_128_hexdigest(data.encode('utf-8'))
+
+
+# ============================================
+# LEGACY (MD5) KEYS
+# ============================================
+# Keys were MD5 digests of the same strings before the switch to XXH3.
+# Upserts also look a listing up by its MD5 key so documents stored before
+# the switch are re-keyed in place instead of reappearing as new listings.
+# Every MD5-keyed document is re-keyed or expired (TTL index) within one TTL
+# window (48h) of deploying, after which this fallback can be removed.
+
+def legacy_job_hash(title: str, company: str, url: str) -> str:
+    """MD5 key a job had before the switch to XXH3"""
+    data = f"{title.lower().strip()}|{company.lower().strip()}|{url.strip()}"
+    return hashlib.md5(data.encode('utf-8')).hexdigest()
+
+
+def legacy_course_hash(title: str, platform: str) -> str:
+    """MD5 key a course had before the switch to XXH3"""
+    data = f"{title.lower().strip()}|{platform.lower().strip()}"
     return hashlib.md5(data.encode('utf-8')).hexdigest()
 
 
+async def upsert_by_hash(collection, document: Dict[str, Any], legacy_hash: str):
+    """
+    Upsert a listing by its hash, re-keying a document stored under its legacy key
+    
+    Args:
+        collection: MongoDB collection
+        document: Listing with its 'hash'
+        legacy_hash: MD5 key of the same listing
+        
+    Returns:
+        UpdateResult of the write
+    """
+    result = await collection.update_one({"hash": document['hash']}, {"$set": document})
+    if result.matched_count:
+        return result
+    
+    # Not stored under the new key - re-key the legacy document, or insert
+    return await collection.update_one(
+        {"hash": legacy_hash},
+        {"$set": document},
+        upsert=True
+    )
+
+
 def is_duplicate(collection, hash_value: str) -> bool:
     """
     Check if hash already exists in collection
@@ -0,0 +1,37 @@
+"""
+Bounded LRU mapping
+Caps per-user in-memory state so unique-user floods can't grow it forever
+"""
+
+from collections import OrderedDict
+
+# Default cap for per-user middleware state
+MAX_TRACKED_USERS = 50_000
+
+
+class LRUDict(OrderedDict):
+    """
+    OrderedDict that evicts its least recently used keys beyond maxsize
+    
+    Assignment marks a key as most recently used; reads don't (call touch).
+    """
+    
+    def __init__(self, maxsize: int = MAX_TRACKED_USERS):
+        """
+        Initialize the mapping
+        
+        Args:
+            maxsize: Maximum number of keys kept
+        """
+        super().__init__()
+        self.maxsize = maxsize
+    
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        while len(self) > self.maxsize:
+            self.popitem(last=False)
+    
+    def touch(self, key):
+        """Mark an existing key as most recently used"""
+        self.move_to_end(key)
@@ -0,0 +1,99 @@
+"""
+Menu rendering helpers
+Skip Telegram round-trips when a menu is already on screen
+"""
+
+import html
+import re
+from typing import Optional, Tuple
+
+from aiogram.types import CallbackQuery, InlineKeyboardMarkup
+
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+
+def _plain_text(text: str) -> str:
+    """
+    Plain text Telegram shows for an HTML message text
+
+    Args:
+        text: Message text (HTML)
+
+    Returns:
+        Text without tags and entities, surrounding whitespace stripped
+    """
+    return html.unescape(_HTML_TAG_RE.sub('', text)).strip()
+
+
+def _keyboard_key(reply_markup: Optional[InlineKeyboardMarkup]) -> Tuple:
+    """
+    Comparable projection of an inline keyboard
+
+    Telegram echoes buttons back with only the fields that were set, so
+    (text, callback_data, url) per button is stable between a locally built
+    keyboard and the one parsed from the message.
+
+    Args:
+        reply_markup: Inline keyboard (or None)
+
+    Returns:
+        Tuple of rows, each a tuple of (text, callback_data, url)
+    """
+    if reply_markup is None:
+        return ()
+    return tuple(
+        tuple((button.text, button.callback_data, button.url) for button in row)
+        for row in reply_markup.inline_keyboard
+    )
+
+
+def is_menu_shown(
+    callback: CallbackQuery,
+    text: str,
+    reply_markup: Optional[InlineKeyboardMarkup] = None
+) -> bool:
+    """
+    Check whether the callback's message already shows this menu
+
+    Compares plain text and button projections rather than the HTML and
+    markup objects, since Telegram returns the text as plain text + entities.
+
+    Args:
+        callback: Incoming callback query
+        text: Menu text (HTML)
+        reply_markup: Menu keyboard
+
+    Returns:
+        True if text and keyboard match the message on screen
+    """
+    message = callback.message
+
+    # Inaccessible (old) and media messages carry no text to compare
+    current_text = getattr(message, "text", None)
+    if current_text is None:
+        return False
+
+    return (
+        current_text == _plain_text(text)
+        and _keyboard_key(message.reply_markup) == _keyboard_key(reply_markup)
+    )
+
+
+async def edit_menu(
+    callback: CallbackQuery,
+    text: str,
+    reply_markup: Optional[InlineKeyboardMarkup] = None
+) -> None:
+    """
+    Edit the callback's message to show a menu, unless it already does
+
+    Double taps and "back" to the current screen would otherwise cost a
+    Bot API request that Telegram rejects with "message is not modified".
+
+    Args:
+        callback: Incoming callback query
+        text: Menu text (HTML)
+        reply_markup: Menu keyboard
+    """
+    if not is_menu_shown(callback, text, reply_markup):
+        await callback.message.edit_text(text, reply_markup=reply_markup)
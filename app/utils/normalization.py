@@ -12,7 +12,7 @@ def normalize_job_data(
     raw_data: Dict[str, Any],
     source: str,
     default_country: str = "global"
-) -> Dict[str, Any]:
+) -> Optional[Dict[str, Any]]:
     """
     Normalize job data from various sources
     
@@ -22,7 +22,7 @@ def normalize_job_data(
         default_country: Default country if not specified
         
     Returns:
-        Normalized job dictionary
+        Normalized job dictionary, or None if the input is malformed
     """
     # Extract common fields with fallbacks
     title = raw_data.get('title') or raw_data.get('job_title') or raw_data.get('position', 'Untitled')
@@ -31,6 +31,10 @@ def normalize_job_data(
     description = raw_data.get('description') or raw_data.get('job_description') or ''
     url = raw_data.get('url') or raw_data.get('link') or raw_data.get('apply_url', '')
     
+    # Malformed entries are skipped by the caller instead of raising
+    if not _all_str(title, company, location, description, url):
+        return None
+    
     # Determine job type
     job_type = determine_job_type(title, description, location)
     
@@ -70,7 +74,7 @@ def normalize_job_data(
 def normalize_course_data(
     raw_data: Dict[str, Any],
     source: str
-) -> Dict[str, Any]:
+) -> Optional[Dict[str, Any]]:
     """
     Normalize course data from various platforms
     
@@ -79,7 +83,7 @@ def normalize_course_data(
         source: Source identifier
         
     Returns:
-        Normalized course dictionary
+        Normalized course dictionary, or None if the input is malformed
     """
     # Extract common fields
     title = raw_data.get('title') or raw_data.get('name') or 'Untitled Course'
@@ -88,6 +92,10 @@ def normalize_course_data(
     description = raw_data.get('description') or raw_data.get('summary') or ''
     url = raw_data.get('url') or raw_data.get('link') or ''
     
+    # Malformed entries are skipped by the caller instead of raising
+    if not _all_str(title, platform, description, url):
+        return None
+    
     # Determine difficulty
     difficulty = determine_difficulty(raw_data.get('difficulty') or raw_data.get('level'))
     
@@ -125,6 +133,11 @@ def normalize_course_data(
 
 # Helper functions
 
+def _all_str(*values: Any) -> bool:
+    """Check that every extracted field is a string"""
+    return all(isinstance(value, str) for value in values)
+
+
 def clean_text(text: str) -> str:
     """Remove extra whitespace and HTML tags"""
     if not text:
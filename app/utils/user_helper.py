@@ -3,11 +3,23 @@ User helper functions for creation, updates, and statistics
 """
 
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 import logging
+import time
 
 system_logger = logging.getLogger(__name__)
 
+# Short-lived cache for get_user_stats: {user_id: (expires_at, stats)}
+# Stats shown in /profile don't need to be fresh to the second
+STATS_CACHE_TTL = 30  # seconds
+STATS_CACHE_MAX_SIZE = 10_000
+_stats_cache: Dict[int, Tuple[float, Optional[Dict[str, Any]]]] = {}
+
+
+def invalidate_user_stats(user_id: int) -> None:
+    """Drop cached statistics for a user"""
+    _stats_cache.pop(user_id, None)
+
 
 async def create_or_update_user(
     db,
@@ -76,6 +88,7 @@ async def create_or_update_user(
             
             await db.users.insert_one(user_data)
         
+        invalidate_user_stats(telegram_id)
         return True
         
     except Exception as e:
@@ -109,6 +122,7 @@ async def increment_user_stats(
                 "$set": {"last_active": datetime.utcnow()}
             }
         )
+        invalidate_user_stats(user_id)
         return True
         
     except Exception as e:
@@ -140,6 +154,7 @@ async def add_module_to_user(
                 "$set": {"last_active": datetime.utcnow()}
             }
         )
+        invalidate_user_stats(user_id)
         return True
         
     except Exception as e:
@@ -152,7 +167,7 @@ async def get_user_stats(
     user_id: int
 ) -> Optional[Dict[str, Any]]:
     """
-    Get user statistics
+    Get user statistics (cached for STATS_CACHE_TTL seconds)
     
     Args:
         db: MongoDB database instance
@@ -161,6 +176,11 @@ async def get_user_stats(
     Returns:
         dict: User statistics or None
     """
+    now = time.monotonic()
+    cached = _stats_cache.get(user_id)
+    if cached and cached[0] > now:
+        return cached[1]
+    
     try:
         user = await db.users.find_one(
             {"telegram_id": user_id},
@@ -173,6 +193,15 @@ async def get_user_stats(
                 "tier": 1
             }
         )
+        
+        # Lazily evict expired entries once the cache is full
+        if len(_stats_cache) >= STATS_CACHE_MAX_SIZE:
+            for key in [k for k, (expires, _) in _stats_cache.items() if expires <= now]:
+                del _stats_cache[key]
+            if len(_stats_cache) >= STATS_CACHE_MAX_SIZE:
+                _stats_cache.pop(next(iter(_stats_cache)))
+        
+        _stats_cache[user_id] = (now + STATS_CACHE_TTL, user)
         return user
         
     except Exception as e:
@@ -0,0 +1,93 @@
+"""
+Tests for app.utils.menu
+Menus already on screen must not be edited again
+"""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+# Needs the app's requirements (aiogram, pytest-asyncio); skip cleanly without them
+pytest.importorskip("aiogram")
+pytest.importorskip("pytest_asyncio")
+
+from aiogram.types import CallbackQuery, InlineKeyboardButton, InlineKeyboardMarkup, Message  # noqa: E402
+
+from app.utils.menu import edit_menu, is_menu_shown  # noqa: E402
+
+MENU_TEXT = "<b>Main Menu</b>\n\nChoose a module &amp; go:\n"
+
+
+def _menu_keyboard() -> InlineKeyboardMarkup:
+    """Keyboard as a handler builds it locally"""
+    return InlineKeyboardMarkup(inline_keyboard=[
+        [InlineKeyboardButton(text="💼 Jobs", callback_data="jobs_menu")],
+        [
+            InlineKeyboardButton(text="📚 Courses", callback_data="courses_menu"),
+            InlineKeyboardButton(text="🌐 Site", url="https://example.com/"),
+        ],
+    ])
+
+
+def _callback(text: str, entities: list, inline_keyboard: list) -> CallbackQuery:
+    """Callback query as parsed from a Telegram update (plain text + entities)"""
+    return CallbackQuery.model_validate({
+        "id": "1",
+        "chat_instance": "1",
+        "data": "main_menu",
+        "from": {"id": 42, "is_bot": False, "first_name": "Test"},
+        "message": {
+            "message_id": 7,
+            "date": 1700000000,
+            "chat": {"id": 42, "type": "private"},
+            "text": text,
+            "entities": entities,
+            "reply_markup": {"inline_keyboard": inline_keyboard},
+        },
+    })
+
+
+def _shown_callback() -> CallbackQuery:
+    """Callback whose message already shows MENU_TEXT and _menu_keyboard()"""
+    return _callback(
+        "Main Menu\n\nChoose a module & go:",
+        [{"type": "bold", "offset": 0, "length": 9}],
+        [
+            [{"text": "💼 Jobs", "callback_data": "jobs_menu"}],
+            [
+                {"text": "📚 Courses", "callback_data": "courses_menu"},
+                {"text": "🌐 Site", "url": "https://example.com/"},
+            ],
+        ],
+    )
+
+
+def test_menu_on_screen_is_detected():
+    assert is_menu_shown(_shown_callback(), MENU_TEXT, _menu_keyboard())
+
+
+def test_changed_keyboard_is_not_shown():
+    keyboard = InlineKeyboardMarkup(inline_keyboard=[
+        [InlineKeyboardButton(text="💼 Jobs", callback_data="jobs_page_2")],
+        *_menu_keyboard().inline_keyboard[1:],
+    ])
+    assert not is_menu_shown(_shown_callback(), MENU_TEXT, keyboard)
+
+
+def test_changed_text_is_not_shown():
+    assert not is_menu_shown(_shown_callback(), "<b>Jobs</b>", _menu_keyboard())
+
+
+@pytest.mark.asyncio
+async def test_repeated_tap_skips_edit():
+    with patch.object(Message, "edit_text", new_callable=AsyncMock) as edit_text:
+        await edit_menu(_shown_callback(), MENU_TEXT, _menu_keyboard())
+    edit_text.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_new_menu_is_edited():
+    callback = _callback("Previous screen", [], [[{"text": "⬅️ Back", "callback_data": "main_menu"}]])
+    with patch.object(Message, "edit_text", new_callable=AsyncMock) as edit_text:
+        await edit_menu(callback, MENU_TEXT, _menu_keyboard())
+    edit_text.assert_awaited_once()